@@ -4,6 +4,7 @@
 import os
 from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import spacy
 from dotenv import load_dotenv
@@ -60,9 +61,24 @@ class Settings(BaseSettings):
 
     mongodb_uri: str = Field(default_factory=_load_mongo_uri_from_env)
     mongodb_database: str = "etl_db"  # Single fixed database for entire ETL pipeline
+    # MongoClient tuning; each is opt-in and None keeps the driver default
+    mongodb_pool_size: Optional[int] = None
+    mongodb_min_pool_size: Optional[int] = None
+    mongodb_max_idle_time_ms: Optional[int] = None
+    mongodb_server_selection_timeout_ms: Optional[int] = None
+    mongodb_socket_timeout_ms: Optional[int] = None
+    mongodb_compressors: Optional[str] = None  # e.g. "zstd,snappy,zlib" when the codecs are installed
+    mongodb_write_concern: Optional[str] = None  # e.g. "majority" or "1"
     database_prefix: str = "etl_"
     sqlite_db_path: str = "./data/sqlite/etl_pipeline.db"  # Tier-B: legacy SQLite database path
     sqlite_base_dir: str = "./data/sqlite"  # Base dir for per-version DB files
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_temp_store: str = "MEMORY"
+    sqlite_mmap_bytes: int = 1073741824  # 1 GiB mmap window per database file; 0 disables
+    sqlite_cache_size_kib: int = 65536  # 64 MiB page cache
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_wal_autocheckpoint: int = 10000  # pages
     environment: str = "development"
     api_host: str = "0.0.0.0"
     api_port: int = 8000
@@ -3,6 +3,6 @@
 SUPPORTED_SOURCE_TYPES = ("json", "kv")
 DEFAULT_CONFIDENCE = 1.0
 SCHEMA_ID_TEMPLATE = "{source_id}_v{version}"
-DEFAULT_BATCH_SIZE = 100
+DEFAULT_BATCH_SIZE = 1000
 MAX_SCHEMA_FIELDS = 500
 MONGODB_COMPATIBLE_DBS = ["mongodb"]
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import List, Union
 
-from .pdf_parser import parse_pdf_file
+from utils.file_handler import decode_text, read_text_file
+
+from .pdf_parser import parse_pdf_bytes, parse_pdf_file
 
 
 def parse_file(file_path: str) -> str:
@@ -22,6 +24,27 @@ def parse_file(file_path: str) -> str:
     raise NotImplementedError(f"Unsupported file type: {suffix}")
 
 
+def parse_bytes(content: Union[bytes, str], filename: str) -> str:
+    """Dispatch parsing of in-memory content based on the filename's extension.
+    
+    Args:
+        content: File body; text formats also accept an already decoded str
+        filename: Original filename, used only for its extension
+        
+    Returns:
+        Text content, as ``parse_file`` would return for the same file
+    """
+
+    suffix = Path(filename).suffix.lower()
+    if suffix in (".md", ".txt"):
+        return decode_text(content)
+    if suffix == ".pdf":
+        if not isinstance(content, bytes):
+            raise ValueError("PDF content must be bytes")
+        return parse_pdf_bytes(content, Path(filename).name)
+    raise NotImplementedError(f"Unsupported file type: {suffix}")
+
+
 def parse_txt_file(file_path: str) -> str:
     """Return plain text content.
     
@@ -31,8 +54,7 @@ def parse_txt_file(file_path: str) -> str:
     Returns:
         Raw text content as string
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    return read_text_file(file_path)
 
 
 def parse_md_file(file_path: str) -> str:
@@ -44,8 +66,7 @@ def parse_md_file(file_path: str) -> str:
     Returns:
         Raw markdown content as string
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    return read_text_file(file_path)
 
 
 def extract_code_blocks(md_content: str) -> List[str]:
@@ -7,23 +7,36 @@ import re
 from typing import Any, Dict, List, Optional
 
 from core import ExtractedRecord
+from utils.serialization import loads_json
 
 from .base import BaseExtractor
 
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+
+# Characters that change bracket-scan state in extract_json_fragments
+_JSON_SCAN_RE = re.compile(r'[{}"\\]')
+
 
 class JSONExtractor(BaseExtractor):
     """Extractor for JSON fragments and code blocks."""
 
-    def extract(self, content: str) -> List[ExtractedRecord]:
+    def extract(
+        self,
+        content: str,
+        fragments: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[ExtractedRecord]:
         """Extract JSON fragments from content and return as ExtractedRecords.
         
         Args:
             content: Raw text content potentially containing JSON fragments
+            fragments: Optional output of ``extract_json_fragments(content)``
+                when the caller has already scanned the text
             
         Returns:
             List of ExtractedRecord objects for each valid JSON fragment found
         """
-        fragments = extract_json_fragments(content)
+        if fragments is None:
+            fragments = extract_json_fragments(content)
         records = []
         
         for fragment in fragments:
@@ -66,6 +79,9 @@ def extract_json_fragments(text: str) -> List[Dict[str, Any]]:
     """Find and parse JSON blobs within text using bracket-stack scanning.
     
     Uses a conservative approach scanning for balanced {...} regions.
+    Only the characters that affect the scan (braces, quotes and
+    backslashes) are visited; everything between them is skipped by a
+    compiled regex search instead of a per-character Python loop.
     
     Args:
         text: Raw text potentially containing JSON fragments
@@ -74,62 +90,50 @@ def extract_json_fragments(text: str) -> List[Dict[str, Any]]:
         List of dicts with keys: raw, start, end, chunk_id
     """
     fragments = []
-    i = 0
     chunk_counter = 1
+    find = text.find
+    search = _JSON_SCAN_RE.search
     
-    while i < len(text):
-        # Look for opening brace
-        if text[i] == '{':
-            start_idx = i
-            stack = ['{']
-            i += 1
-            in_string = False
-            escape_next = False
+    # Look for opening brace
+    i = find('{')
+    while i != -1:
+        start_idx = i
+        depth = 1
+        in_string = False
+        pos = i + 1
+        
+        # Scan for balanced closing brace
+        while depth:
+            match = search(text, pos)
+            if match is None:
+                break
+            char = match.group()
+            pos = match.end()
             
-            # Scan for balanced closing brace
-            while i < len(text) and stack:
-                char = text[i]
-                
-                # Handle escape sequences in strings
-                if escape_next:
-                    escape_next = False
-                    i += 1
-                    continue
-                
-                if char == '\\':
-                    escape_next = True
-                    i += 1
-                    continue
-                
-                # Handle string boundaries
-                if char == '"':
-                    in_string = not in_string
-                    i += 1
-                    continue
-                
-                # Only process braces outside of strings
-                if not in_string:
-                    if char == '{':
-                        stack.append('{')
-                    elif char == '}':
-                        stack.pop()
-                
-                i += 1
+            # Handle escape sequences: skip the escaped character
+            if char == '\\':
+                pos += 1
+                continue
             
-            # If stack is empty, we found a balanced JSON candidate
-            if not stack and i > start_idx:
-                end_idx = i
-                raw_json = text[start_idx:end_idx]
-                
-                fragments.append({
-                    "raw": raw_json,
-                    "start": start_idx,
-                    "end": end_idx,
-                    "chunk_id": f"json_{chunk_counter}"
-                })
-                chunk_counter += 1
-        else:
-            i += 1
+            # Handle string boundaries
+            if char == '"':
+                in_string = not in_string
+            # Only process braces outside of strings
+            elif not in_string:
+                depth += 1 if char == '{' else -1
+        
+        # An unbalanced candidate runs to the end of the text
+        if depth:
+            break
+        
+        fragments.append({
+            "raw": text[start_idx:pos],
+            "start": start_idx,
+            "end": pos,
+            "chunk_id": f"json_{chunk_counter}"
+        })
+        chunk_counter += 1
+        i = find('{', pos)
     
     return fragments
 
@@ -164,7 +168,7 @@ def parse_json_string(json_str: str) -> Optional[Dict[str, Any]]:
     """
     # First attempt: parse as-is
     try:
-        result = json.loads(json_str)
+        result = loads_json(json_str)
         if isinstance(result, dict):
             return result
         # If result is not a dict (e.g., list, string), wrap it
@@ -174,8 +178,8 @@ def parse_json_string(json_str: str) -> Optional[Dict[str, Any]]:
     
     # Second attempt: remove trailing commas
     try:
-        fixed = re.sub(r',(\s*[}\]])', r'\1', json_str)
-        result = json.loads(fixed)
+        fixed = _TRAILING_COMMA_RE.sub(r'\1', json_str)
+        result = loads_json(fixed)
         if isinstance(result, dict):
             return result
         return {"_value": result}
@@ -187,7 +191,7 @@ def parse_json_string(json_str: str) -> Optional[Dict[str, Any]]:
     if '"' not in json_str and "'" in json_str:
         try:
             fixed = json_str.replace("'", '"')
-            result = json.loads(fixed)
+            result = loads_json(fixed)
             if isinstance(result, dict):
                 return result
             return {"_value": result}
@@ -198,8 +202,8 @@ def parse_json_string(json_str: str) -> Optional[Dict[str, Any]]:
     if "'" in json_str:
         try:
             fixed = json_str.replace("'", '"')
-            fixed = re.sub(r',(\s*[}\]])', r'\1', fixed)
-            result = json.loads(fixed)
+            fixed = _TRAILING_COMMA_RE.sub(r'\1', fixed)
+            result = loads_json(fixed)
             if isinstance(result, dict):
                 return result
             return {"_value": result}
@@ -8,21 +8,30 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 from core import ExtractedRecord
 
 from .base import BaseExtractor
+from .json_extractor import extract_json_fragments
+
+_KEY_LABEL_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_\s\-]*$')
 
 
 class KVExtractor(BaseExtractor):
     """Extractor for structured key-value sections."""
 
-    def extract(self, content: str) -> List[ExtractedRecord]:
+    def extract(
+        self,
+        content: str,
+        json_regions: Optional[List[Tuple[int, int]]] = None,
+    ) -> List[ExtractedRecord]:
         """Extract key-value blocks from text and return as ExtractedRecords.
         
         Args:
             content: Raw text content potentially containing key-value pairs
+            json_regions: Optional (start, end) spans of JSON fragments already
+                found in ``content``; scanned here when not given
             
         Returns:
             List of ExtractedRecord objects for each KV block found
         """
-        fragments = extract_key_value_pairs(content)
+        fragments = extract_key_value_pairs(content, json_regions)
         records = []
         
         for fragment in fragments:
@@ -43,7 +52,9 @@ class KVExtractor(BaseExtractor):
         return records
 
 
-def extract_key_value_pairs(text: str) -> List[Dict[str, Any]]:
+def extract_key_value_pairs(
+    text: str, json_regions: Optional[List[Tuple[int, int]]] = None
+) -> List[Dict[str, Any]]:
     """Extract key-value blocks from text, avoiding JSON regions.
     
     Identifies contiguous blocks of "key: value" lines and returns them
@@ -51,28 +62,19 @@ def extract_key_value_pairs(text: str) -> List[Dict[str, Any]]:
     
     Args:
         text: Raw text potentially containing key-value pairs
+        json_regions: Optional precomputed JSON spans to skip
         
     Returns:
         List of dicts with keys: raw, start, end, chunk_id, content
     """
-    # Use extract_kv_fragments to get base fragments
-    fragments = extract_kv_fragments(text)
+    fragments = []
     
-    # Parse each fragment's content into key-value dictionary
-    for fragment in fragments:
-        raw = fragment["raw"]
-        content = {}
-        
-        # Parse each line in the raw text
-        for line in raw.split('\n'):
-            parsed = parse_kv_line(line)
-            if parsed:
-                key, value = parsed
-                # If duplicate keys exist, keep the last one (deterministic)
-                content[key] = value
-        
-        # Add content to fragment
-        fragment["content"] = content
+    # Build each fragment's key-value dictionary from the pairs parsed while
+    # the block was detected, instead of splitting and parsing its raw text again
+    for fragment, block_lines in _extract_kv_blocks(text, json_regions):
+        # If duplicate keys exist, keep the last one (deterministic)
+        fragment["content"] = dict(item["parsed"] for item in block_lines)
+        fragments.append(fragment)
     
     return fragments
 
@@ -143,7 +145,7 @@ def parse_kv_line(line: str) -> Optional[Tuple[str, str]]:
     
     # Check if key looks like a valid identifier/label
     # Allow letters, numbers, spaces, underscores, hyphens
-    if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_\s\-]*$', key):
+    if not _KEY_LABEL_RE.match(key):
         return None
     
     # Value should exist (even if empty string after colon)
@@ -155,7 +157,8 @@ def parse_kv_line(line: str) -> Optional[Tuple[str, str]]:
 def _find_json_regions(text: str) -> List[Tuple[int, int]]:
     """Find byte ranges occupied by JSON fragments in the text.
     
-    Uses simplified bracket scanning to identify JSON object regions.
+    Reuses the JSON extractor's bracket scan so both extractors agree on
+    which regions are JSON.
     
     Args:
         text: Raw text to scan
@@ -163,49 +166,7 @@ def _find_json_regions(text: str) -> List[Tuple[int, int]]:
     Returns:
         List of (start, end) byte position tuples for JSON regions
     """
-    regions = []
-    i = 0
-    
-    while i < len(text):
-        if text[i] == '{':
-            start_idx = i
-            stack = ['{']
-            i += 1
-            in_string = False
-            escape_next = False
-            
-            while i < len(text) and stack:
-                char = text[i]
-                
-                if escape_next:
-                    escape_next = False
-                    i += 1
-                    continue
-                
-                if char == '\\':
-                    escape_next = True
-                    i += 1
-                    continue
-                
-                if char == '"':
-                    in_string = not in_string
-                    i += 1
-                    continue
-                
-                if not in_string:
-                    if char == '{':
-                        stack.append('{')
-                    elif char == '}':
-                        stack.pop()
-                
-                i += 1
-            
-            if not stack and i > start_idx:
-                regions.append((start_idx, i))
-        else:
-            i += 1
-    
-    return regions
+    return [(fragment["start"], fragment["end"]) for fragment in extract_json_fragments(text)]
 
 
 def _is_in_json_region(line_start: int, line_end: int, json_regions: List[Tuple[int, int]]) -> bool:
@@ -226,7 +187,9 @@ def _is_in_json_region(line_start: int, line_end: int, json_regions: List[Tuple[
     return False
 
 
-def extract_kv_fragments(text: str) -> List[Dict[str, Any]]:
+def extract_kv_fragments(
+    text: str, json_regions: Optional[List[Tuple[int, int]]] = None
+) -> List[Dict[str, Any]]:
     """Extract KV blocks of 'key: value' lines with offsets.
     
     Uses splitlines(keepends=True) and cumulative length-based offsets
@@ -234,17 +197,33 @@ def extract_kv_fragments(text: str) -> List[Dict[str, Any]]:
     
     Args:
         text: Raw text potentially containing key-value pairs
+        json_regions: Optional precomputed JSON spans to skip; when omitted
+            the text is scanned for them
         
     Returns:
         List of dicts with keys: raw, start, end, chunk_id
     """
+    return [fragment for fragment, _ in _extract_kv_blocks(text, json_regions)]
+
+
+def _extract_kv_blocks(
+    text: str, json_regions: Optional[List[Tuple[int, int]]] = None
+) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """Group consecutive KV lines into blocks.
+    
+    Returns:
+        List of (fragment, block_lines) tuples, where block_lines holds the
+        per-line dicts (including the "parsed" key/value) the fragment was
+        built from
+    """
     # First, identify JSON regions to exclude
-    json_regions = _find_json_regions(text)
+    if json_regions is None:
+        json_regions = _find_json_regions(text)
     
     # Split into lines while preserving line endings
     lines = text.splitlines(keepends=True)
     
-    fragments = []
+    blocks = []
     current_block_lines = []
     current_block_start = 0
     block_counter = 1
@@ -269,7 +248,7 @@ def extract_kv_fragments(text: str) -> List[Dict[str, Any]]:
                     block_counter
                 )
                 if fragment:
-                    fragments.append(fragment)
+                    blocks.append((fragment, current_block_lines))
                     block_counter += 1
                 current_block_lines = []
             
@@ -307,7 +286,7 @@ def extract_kv_fragments(text: str) -> List[Dict[str, Any]]:
                         block_counter
                     )
                     if fragment:
-                        fragments.append(fragment)
+                        blocks.append((fragment, current_block_lines))
                         block_counter += 1
                     current_block_lines = []
         
@@ -322,9 +301,9 @@ def extract_kv_fragments(text: str) -> List[Dict[str, Any]]:
             block_counter
         )
         if fragment:
-            fragments.append(fragment)
+            blocks.append((fragment, current_block_lines))
     
-    return fragments
+    return blocks
 
 
 def _finalize_kv_fragment(
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 
 from core import ExtractedRecord
 from utils.logger import get_logger
 
-from .file_parser import parse_file
-from .json_extractor import JSONExtractor
+from .file_parser import parse_bytes, parse_file
+from .json_extractor import JSONExtractor, extract_json_fragments
 from .kv_extractor import KVExtractor
 from .html_extractor import HTMLExtractor
 from .csv_extractor import CSVExtractor
@@ -16,6 +16,13 @@ from .yaml_extractor import YAMLExtractor
 
 logger = get_logger(__name__)
 
+# Extractors keep no per-call state, so one instance of each serves every upload.
+_JSON_EXTRACTOR = JSONExtractor()
+_KV_EXTRACTOR = KVExtractor()
+_HTML_EXTRACTOR = HTMLExtractor()
+_CSV_EXTRACTOR = CSVExtractor()
+_YAML_EXTRACTOR = YAMLExtractor()
+
 
 def extract_all_records(file_path: str) -> Tuple[List[ExtractedRecord], Dict[str, int]]:
     """Run all extractors against the file and return stats.
@@ -27,24 +34,40 @@ def extract_all_records(file_path: str) -> Tuple[List[ExtractedRecord], Dict[str
         Tuple of (all_records, extraction_stats)
     """
     # Parse the file to get text content
-    text = parse_file(file_path)
-    pdf_pages = _count_pdf_pages(text)
+    return extract_records_from_text(parse_file(file_path))
+
+
+def extract_records_from_bytes(
+    content: Union[bytes, str], filename: str
+) -> Tuple[List[ExtractedRecord], Dict[str, int]]:
+    """Run all extractors against in-memory file content and return stats.
     
-    # Initialize Tier-A extractors
-    json_extractor = JSONExtractor()
-    kv_extractor = KVExtractor()
+    Args:
+        content: File body (text formats also accept a decoded str)
+        filename: Original filename, used to pick the parser
+        
+    Returns:
+        Tuple of (all_records, extraction_stats)
+    """
+    return extract_records_from_text(parse_bytes(content, filename))
+
+
+def extract_records_from_text(text: str) -> Tuple[List[ExtractedRecord], Dict[str, int]]:
+    """Run all extractors against already parsed text content and return stats.
     
-    # Initialize Tier-B extractors
-    html_extractor = HTMLExtractor()
-    csv_extractor = CSVExtractor()
-    yaml_extractor = YAMLExtractor()
+    Args:
+        text: Text content produced by the file parsers
+        
+    Returns:
+        Tuple of (all_records, extraction_stats)
+    """
+    pdf_pages = _count_pdf_pages(text)
     
-    # Extract all fragments
-    json_records = json_extractor.extract(text)
-    kv_records = kv_extractor.extract(text)
-    html_records = html_extractor.extract(text)
-    csv_records = csv_extractor.extract(text)
-    yaml_records = yaml_extractor.extract(text)
+    # Extract all fragments (Tier-A: JSON, KV; Tier-B: HTML, CSV, YAML)
+    json_records, kv_records = extract_json_and_kv(text)
+    html_records = _HTML_EXTRACTOR.extract(text)
+    csv_records = _CSV_EXTRACTOR.extract(text)
+    yaml_records = _YAML_EXTRACTOR.extract(text)
     
     # Combine records
     all_records = combine_extracted_records(
@@ -69,6 +92,26 @@ def extract_all_records(file_path: str) -> Tuple[List[ExtractedRecord], Dict[str
     return all_records, stats
 
 
+def extract_json_and_kv(text: str) -> Tuple[List[ExtractedRecord], List[ExtractedRecord]]:
+    """Run the JSON and KV extractors over one shared JSON bracket scan.
+    
+    The KV extractor must skip lines inside JSON objects, which it finds with
+    the same bracket scan the JSON extractor performs; scanning once and
+    handing the spans to both halves the work on mixed documents.
+    
+    Args:
+        text: Raw text content
+        
+    Returns:
+        Tuple of (json_records, kv_records)
+    """
+    json_fragments = extract_json_fragments(text)
+    json_regions = [(fragment["start"], fragment["end"]) for fragment in json_fragments]
+    json_records = _JSON_EXTRACTOR.extract(text, fragments=json_fragments)
+    kv_records = _KV_EXTRACTOR.extract(text, json_regions=json_regions)
+    return json_records, kv_records
+
+
 def combine_extracted_records(
     json_records: List[ExtractedRecord],
     kv_records: List[ExtractedRecord],
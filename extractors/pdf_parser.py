@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import re
-from io import StringIO
+from io import BytesIO, StringIO
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, List
 
 from pdfminer.high_level import extract_text_to_fp  # type: ignore[import]
 from pdfminer.layout import LAParams  # type: ignore[import]
@@ -34,17 +34,40 @@ def parse_pdf_file(file_path: str) -> str:
     if not path.is_file():
         raise ValueError(f"PDF file not found: {file_path}")
 
+    with path.open("rb") as pdf_file:
+        return _parse_pdf_stream(pdf_file, path.name)
+
+
+def parse_pdf_bytes(content: bytes, name: str = "<bytes>") -> str:
+    """Return normalized text content extracted from an in-memory PDF.
+
+    Args:
+        content: Raw bytes of the PDF document.
+        name: Label used in log messages, typically the original filename.
+
+    Returns:
+        Unicode text extracted from the PDF with page delimiters inserted.
+
+    Raises:
+        ValueError: If the PDF cannot be parsed or contains no textual data.
+    """
+
+    return _parse_pdf_stream(BytesIO(content), name)
+
+
+def _parse_pdf_stream(pdf_file: BinaryIO, name: str) -> str:
+    """Extract and normalize text from an open binary PDF stream."""
+
     laparams = LAParams()
     buffer = StringIO()
 
-    with path.open("rb") as pdf_file:
-        extract_text_to_fp(
-            pdf_file,
-            buffer,
-            laparams=laparams,
-            output_type="text",
-            codec="utf-8",
-        )
+    extract_text_to_fp(
+        pdf_file,
+        buffer,
+        laparams=laparams,
+        output_type="text",
+        codec="utf-8",
+    )
 
     raw_text = buffer.getvalue()
     normalized_pages = _normalize_pdf_text(raw_text)
@@ -55,7 +78,7 @@ def parse_pdf_file(file_path: str) -> str:
         )
 
     page_count = _count_pages(normalized_pages)
-    logger.info("Parsed %d PDF page(s) from '%s'", page_count, path.name)
+    logger.info("Parsed %d PDF page(s) from '%s'", page_count, name)
 
     return normalized_pages
 
@@ -188,6 +188,33 @@ def calculate_field_confidence(
     return type_consistency
 
 
+def type_consistency_from_counts(
+    type_counts: Dict[str, int], expected_type: str
+) -> float:
+    """Measure type consistency from pre-tallied type counts.
+    
+    Equivalent to ``calculate_field_confidence`` for a field whose
+    per-record types were already counted (see
+    ``schema_detector.tally_field_types``), without rescanning records.
+    
+    Args:
+        type_counts: Mapping of type string to occurrence count for one field
+        expected_type: The type we expect (e.g., "integer", "string")
+        
+    Returns:
+        Consistency ratio between 0.0 and 1.0, rounded to 3 decimals
+        
+    Examples:
+        >>> type_consistency_from_counts({"integer": 2, "string": 1}, "integer")
+        0.667
+    """
+    total_count = sum(type_counts.values())
+    if total_count == 0:
+        return 0.0
+    
+    return round(type_counts.get(expected_type, 0) / total_count, 3)
+
+
 def count_field_occurrences(records: List[Dict], field_name: str) -> int:
     """Count how many records contain the field.
     
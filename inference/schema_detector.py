@@ -423,29 +423,52 @@ def detect_data_types(records: List[Dict]) -> Dict[str, str]:
         >>> detect_data_types(records)
         {'age': 'integer'}
     """
-    from .type_mapper import infer_type, merge_types
+    from .type_mapper import merge_type_counts
     
-    if not records:
-        return {}
+    # Merge types to get dominant type for each field
+    return {
+        field_name: merge_type_counts(type_counts)[0]
+        for field_name, type_counts in tally_field_types(records).items()
+    }
+
+
+def tally_field_types(
+    records: List[Dict], example_values: Optional[Dict[str, Any]] = None
+) -> Dict[str, Counter]:
+    """Count the inferred type of every top-level value, per field.
     
-    # Collect types for each field
-    field_types = {}
+    A single pass over the records; fields appear in first-seen order.
     
-    for record in records:
-        for field_name, value in record.items():
-            if field_name not in field_types:
-                field_types[field_name] = []
-            
-            value_type = infer_type(value)
-            field_types[field_name].append(value_type)
+    Args:
+        records: List of normalized record dictionaries
+        example_values: Optional dict that is filled, in the same pass,
+            with the first non-None value seen for each field
+        
+    Returns:
+        Dictionary mapping field names to Counters of type strings
+        
+    Examples:
+        >>> tally_field_types([{"age": 25}, {"age": "n/a"}])
+        {'age': Counter({'integer': 1, 'string': 1})}
+    """
+    from .type_mapper import infer_type
     
-    # Merge types to get dominant type for each field
-    result = {}
-    for field_name, types in field_types.items():
-        dominant_type, _ = merge_types(types)
-        result[field_name] = dominant_type
+    field_type_counts: Dict[str, Counter] = {}
     
-    return result
+    for record in records:
+        for field_name, value in record.items():
+            type_counts = field_type_counts.get(field_name)
+            if type_counts is None:
+                type_counts = field_type_counts[field_name] = Counter()
+            type_counts[infer_type(value)] += 1
+            if (
+                example_values is not None
+                and value is not None
+                and field_name not in example_values
+            ):
+                example_values[field_name] = value
+    
+    return field_type_counts
 
 
 def load_records_to_dataframe(records: List[Dict]) -> pd.DataFrame:
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
 from core import SchemaField, SchemaMetadata
 
-from .confidence_scorer import calculate_field_confidence
-from .schema_detector import detect_data_types
+from .confidence_scorer import type_consistency_from_counts
+from .schema_detector import tally_field_types
+from .type_mapper import merge_type_counts
 from .genson_integration import generate_genson_schema, extract_fields_from_genson_schema, compute_schema_signature
 
 
@@ -51,21 +53,32 @@ def generate_schema(
             extraction_stats={"total_records": 0, "empty_records": 0}
         )
     
-    # Detect field types across all records
-    field_types = detect_data_types(records)
+    # Detect field types across all records, tallying each value's type once
+    # and capturing example values in the same pass
+    example_values: Dict[str, Any] = {}
+    field_type_counts = tally_field_types(records, example_values)
+    field_types = {
+        field_name: merge_type_counts(type_counts)[0]
+        for field_name, type_counts in field_type_counts.items()
+    }
     
     # Generate Genson schema for Tier-B
     genson_schema = generate_genson_schema(records)
     
-    # Calculate confidence for each field
-    field_confidences = {}
-    for field_name, field_type in field_types.items():
-        field_confidences[field_name] = calculate_field_confidence(
-            records, field_name, field_type
-        )
+    # Calculate confidence for each field from the same tallies
+    field_confidences = {
+        field_name: type_consistency_from_counts(field_type_counts[field_name], field_type)
+        for field_name, field_type in field_types.items()
+    }
     
     # Build schema fields
-    schema_fields = build_schema_fields(records, field_types, field_confidences)
+    schema_fields = build_schema_fields(
+        records,
+        field_types,
+        field_confidences,
+        field_type_counts=field_type_counts,
+        example_values=example_values,
+    )
     
     # Generate schema ID
     schema_id = f"{source_id}_v{version}_{uuid4().hex[:8]}"
@@ -93,6 +106,9 @@ def build_schema_fields(
     records: List[Dict],
     field_types: Dict[str, str],
     field_confidences: Dict[str, float],
+    *,
+    field_type_counts: Optional[Dict[str, Counter]] = None,
+    example_values: Optional[Dict[str, Any]] = None,
 ) -> List[SchemaField]:
     """
     Build SchemaField objects with examples and confidences.
@@ -105,6 +121,11 @@ def build_schema_fields(
         records: List of record dictionaries
         field_types: Mapping of field names to their detected types
         field_confidences: Mapping of field names to confidence scores
+        field_type_counts: Optional per-field type tallies from
+            ``tally_field_types``; presence is derived from them
+        example_values: Optional first non-None value per field, as
+            collected by ``tally_field_types``. When both are given the
+            records are not scanned again.
     
     Returns:
         List of SchemaField objects, one per detected field
@@ -119,17 +140,29 @@ def build_schema_fields(
     """
     schema_fields = []
     
+    if field_type_counts is not None and example_values is not None:
+        # Every present value was tallied once, so presence is the tally total
+        present_counts = Counter({
+            field_name: sum(type_counts.values())
+            for field_name, type_counts in field_type_counts.items()
+        })
+    else:
+        # Count field presence and capture the first non-None example value in
+        # a single pass over the records instead of rescanning them per field
+        present_counts = Counter()
+        example_values = {}
+        for record in records:
+            present_counts.update(record.keys())
+            for key, value in record.items():
+                if value is not None and key not in example_values:
+                    example_values[key] = value
+    
     for field_name, field_type in field_types.items():
         # Check if field is nullable (appears in all records)
-        present_count = sum(1 for record in records if field_name in record)
-        is_nullable = present_count < len(records)
+        is_nullable = present_counts[field_name] < len(records)
         
         # Extract example value (first non-None value found)
-        example_value = None
-        for record in records:
-            if field_name in record and record[field_name] is not None:
-                example_value = record[field_name]
-                break
+        example_value = example_values.get(field_name)
         
         # Get confidence score
         confidence = field_confidences.get(field_name, 0.5)
@@ -249,9 +282,9 @@ def compute_schema_diff(
     old_fields_by_name = {field.name: field for field in old_schema.fields}
     new_fields_by_name = {field.name: field for field in new_schema.fields}
 
-    # Extract field name sets
-    old_names = set(old_fields_by_name.keys())
-    new_names = set(new_fields_by_name.keys())
+    # Key views support set algebra directly, without copying into sets
+    old_names = old_fields_by_name.keys()
+    new_names = new_fields_by_name.keys()
 
     # Compute set differences
     added_names = sorted(new_names - old_names)
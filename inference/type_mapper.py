@@ -3,9 +3,23 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
 from datetime import datetime
 from typing import Any, Dict, List, Tuple
 
+# Exact-type lookup for the JSON-native values that make up almost every
+# record; subclasses (and anything else) fall through to the isinstance chain
+_TYPE_NAMES_BY_TYPE = {
+    type(None): "null",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    str: "string",
+    dict: "object",
+    list: "array",
+    tuple: "array",
+}
+
 
 def infer_type(value: Any) -> str:
     """Infer the JSON-schema-like type of a Python value.
@@ -47,6 +61,10 @@ def infer_type(value: Any) -> str:
         >>> infer_type([1, 2, 3])
         'array'
     """
+    type_name = _TYPE_NAMES_BY_TYPE.get(type(value))
+    if type_name is not None:
+        return type_name
+    
     # Handle None first
     if value is None:
         return "null"
@@ -339,13 +357,29 @@ def merge_types(types: List[str]) -> Tuple[str, List[str]]:
         >>> merge_types(["boolean", "boolean", "string", "string"])
         ('boolean', ['boolean', 'string'])  # alphabetical tie-break
     """
-    if not types:
+    return merge_type_counts(Counter(types))
+
+
+def merge_type_counts(type_counts: Dict[str, int]) -> Tuple[str, List[str]]:
+    """Calculate dominant type and union from pre-tallied type counts.
+    
+    Same rules as ``merge_types``, for callers that already counted the
+    types while scanning records. The input mapping is not modified.
+    
+    Args:
+        type_counts: Mapping of type string to occurrence count
+        
+    Returns:
+        Tuple of (dominant_type, sorted_union_list)
+        
+    Examples:
+        >>> merge_type_counts({"integer": 2, "number": 1})
+        ('number', ['number'])
+    """
+    if not type_counts:
         return ("unknown", [])
     
-    # Count frequency of each type
-    type_counts = {}
-    for t in types:
-        type_counts[t] = type_counts.get(t, 0) + 1
+    type_counts = dict(type_counts)
     
     # Handle integer + number promotion
     if "integer" in type_counts and "number" in type_counts:
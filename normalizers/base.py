@@ -2,11 +2,29 @@
 
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
 from typing import Dict, List
 
 from core import NormalizedRecord
 
+# Non-digit characters that int()/float() accept at the start of a number
+NUMBER_LEAD_CHARS = frozenset("+-.iInN")
+
+# Case-folded string values that normalize to None
+NULL_TOKENS = frozenset({"null", "none", "nil", "-", "n/a", "na", "n.a.", "n.a"})
+
+# Case-folded string values that normalize to booleans
+TRUE_TOKENS = frozenset({"true", "yes", "y", "1"})
+FALSE_TOKENS = frozenset({"false", "no", "n", "0"})
+
+# ISO dates and datetimes are kept as strings
+ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+ISO_DATETIME_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+
+# Runs of non-word characters collapsed to "_" in column keys
+NON_WORD_RUN_RE = re.compile(r"[^\w]+")
+
 
 class BaseNormalizer(ABC):
     """Normalize raw extracted payloads into structured data."""
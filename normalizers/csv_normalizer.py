@@ -1,13 +1,21 @@
 """CSV normalizer for Tier-B pipeline."""
 
+import re
 from typing import Any, Dict, List
 
 from core.models import NormalizedRecord
-from normalizers.base import BaseNormalizer
+from normalizers.base import FALSE_TOKENS, NON_WORD_RUN_RE, TRUE_TOKENS, BaseNormalizer
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Narrower than the shared NULL_TOKENS: "-" and "nil" stay text in CSV cells
+_NULL_TOKENS = frozenset({'null', 'none', 'n/a', 'na'})
+
+# Basic patterns for common date formats: ISO 2025-11-10,
+# US 11/10/2025 and EU 10-11-2025
+_DATE_PREFIX_RE = re.compile(r'\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}|\d{2}-\d{2}-\d{4}')
+
 
 class CSVNormalizer(BaseNormalizer):
     """Normalizes CSV data extracted from documents."""
@@ -27,6 +35,11 @@ class CSVNormalizer(BaseNormalizer):
             return []
         
         normalized_records = []
+        append = normalized_records.append
+        # Rows share their column names, so standardize each header once per block
+        key_map: Dict[str, str] = {}
+        standardize_key = self._standardize_key
+        infer_type = self._infer_type
         
         for idx, row in enumerate(data):
             if not isinstance(row, dict):
@@ -36,9 +49,10 @@ class CSVNormalizer(BaseNormalizer):
             # Standardize keys and infer types
             normalized_data = {}
             for key, value in row.items():
-                normalized_key = self._standardize_key(key)
-                normalized_value = self._infer_type(value)
-                normalized_data[normalized_key] = normalized_value
+                normalized_key = key_map.get(key)
+                if normalized_key is None:
+                    normalized_key = key_map[key] = standardize_key(key)
+                normalized_data[normalized_key] = infer_type(value)
             
             # Create normalized record
             record = NormalizedRecord(
@@ -54,7 +68,7 @@ class CSVNormalizer(BaseNormalizer):
                     "delimiter": metadata.get("delimiter", ",")
                 }
             )
-            normalized_records.append(record)
+            append(record)
         
         logger.info(f"Normalized {len(normalized_records)} CSV row(s)")
         return normalized_records
@@ -68,11 +82,10 @@ class CSVNormalizer(BaseNormalizer):
         Returns:
             Standardized key
         """
-        import re
         # Convert to lowercase
         key = key.lower()
         # Replace spaces and special chars with underscore
-        key = re.sub(r'[^\w]+', '_', key)
+        key = NON_WORD_RUN_RE.sub('_', key)
         # Remove leading/trailing underscores
         key = key.strip('_')
         return key or "unknown"
@@ -90,8 +103,9 @@ class CSVNormalizer(BaseNormalizer):
             return value
         
         value = value.strip()
+        value_lower = value.lower()
         
-        if not value or value.lower() in ['null', 'none', 'n/a', 'na']:
+        if not value or value_lower in _NULL_TOKENS:
             return None
         
         # Try integer
@@ -111,9 +125,9 @@ class CSVNormalizer(BaseNormalizer):
             pass
         
         # Check for boolean
-        if value.lower() in ['true', 'yes', 'y', '1']:
+        if value_lower in TRUE_TOKENS:
             return True
-        if value.lower() in ['false', 'no', 'n', '0']:
+        if value_lower in FALSE_TOKENS:
             return False
         
         # Try to parse as date (basic ISO format check)
@@ -133,11 +147,4 @@ class CSVNormalizer(BaseNormalizer):
         Returns:
             True if value appears to be a date
         """
-        import re
-        # Basic patterns for common date formats
-        date_patterns = [
-            r'^\d{4}-\d{2}-\d{2}',  # ISO: 2025-11-10
-            r'^\d{2}/\d{2}/\d{4}',  # US: 11/10/2025
-            r'^\d{2}-\d{2}-\d{4}',  # EU: 10-11-2025
-        ]
-        return any(re.match(pattern, value) for pattern in date_patterns)
+        return _DATE_PREFIX_RE.match(value) is not None
@@ -3,7 +3,7 @@
 from typing import Any, Dict, List
 
 from core.models import NormalizedRecord
-from normalizers.base import BaseNormalizer
+from normalizers.base import FALSE_TOKENS, NON_WORD_RUN_RE, TRUE_TOKENS, BaseNormalizer
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,6 +27,11 @@ class HTMLTableNormalizer(BaseNormalizer):
             return []
         
         normalized_records = []
+        append = normalized_records.append
+        # Rows share their column names, so standardize each header once per block
+        key_map: Dict[str, str] = {}
+        standardize_key = self._standardize_key
+        infer_type = self._infer_type
         
         for idx, row in enumerate(data):
             if not isinstance(row, dict):
@@ -36,9 +41,10 @@ class HTMLTableNormalizer(BaseNormalizer):
             # Standardize keys (lowercase with underscores)
             normalized_data = {}
             for key, value in row.items():
-                normalized_key = self._standardize_key(key)
-                normalized_value = self._infer_type(value)
-                normalized_data[normalized_key] = normalized_value
+                normalized_key = key_map.get(key)
+                if normalized_key is None:
+                    normalized_key = key_map[key] = standardize_key(key)
+                normalized_data[normalized_key] = infer_type(value)
             
             # Create normalized record
             record = NormalizedRecord(
@@ -53,7 +59,7 @@ class HTMLTableNormalizer(BaseNormalizer):
                     "headers": metadata.get("headers", [])
                 }
             )
-            normalized_records.append(record)
+            append(record)
         
         logger.info(f"Normalized {len(normalized_records)} HTML table row(s)")
         return normalized_records
@@ -67,11 +73,10 @@ class HTMLTableNormalizer(BaseNormalizer):
         Returns:
             Standardized key
         """
-        import re
         # Convert to lowercase
         key = key.lower()
         # Replace spaces and special chars with underscore
-        key = re.sub(r'[^\w]+', '_', key)
+        key = NON_WORD_RUN_RE.sub('_', key)
         # Remove leading/trailing underscores
         key = key.strip('_')
         return key or "unknown"
@@ -107,9 +112,10 @@ class HTMLTableNormalizer(BaseNormalizer):
             pass
         
         # Check for boolean
-        if value.lower() in ['true', 'yes', 'y', '1']:
+        value_lower = value.lower()
+        if value_lower in TRUE_TOKENS:
             return True
-        if value.lower() in ['false', 'no', 'n', '0']:
+        if value_lower in FALSE_TOKENS:
             return False
         
         # Return as string
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-import re
 from typing import Any, Dict, List, Optional, Union
 
 from core import NormalizedRecord
 
-from .base import BaseNormalizer
+from .base import (
+    ISO_DATE_RE,
+    ISO_DATETIME_RE,
+    NULL_TOKENS,
+    NUMBER_LEAD_CHARS,
+    BaseNormalizer,
+)
 
 
 class JSONNormalizer(BaseNormalizer):
@@ -23,6 +28,7 @@ class JSONNormalizer(BaseNormalizer):
             List of NormalizedRecord objects with normalized data
         """
         normalized = []
+        append = normalized.append
         
         for record in records:
             # Extract data and metadata
@@ -41,7 +47,7 @@ class JSONNormalizer(BaseNormalizer):
                     extraction_confidence=confidence,
                     provenance={"source": source_type}
                 )
-                normalized.append(norm_record)
+                append(norm_record)
         
         return normalized
 
@@ -152,7 +158,7 @@ def _infer_string_type(value: str) -> Union[str, int, float, bool, None]:
     
     # Null-like values (case-insensitive)
     value_lower = value.lower()
-    if value_lower in ("null", "none", "nil", "-", "n/a", "na", "n.a.", "n.a"):
+    if value_lower in NULL_TOKENS:
         return None
     
     # Boolean values (case-insensitive)
@@ -163,12 +169,18 @@ def _infer_string_type(value: str) -> Union[str, int, float, bool, None]:
     
     # ISO date patterns - keep as strings (no parsing)
     # Pattern 1: YYYY-MM-DD
-    if re.match(r'^\d{4}-\d{2}-\d{2}$', value):
+    if ISO_DATE_RE.match(value):
         return value
     
     # Pattern 2: ISO 8601 datetime
     # YYYY-MM-DDTHH:MM:SS or with timezone/milliseconds
-    if re.match(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}', value):
+    if ISO_DATETIME_RE.match(value):
+        return value
+    
+    # Only a sign, digit, '.', or the start of inf/nan can begin a number;
+    # anything else is text, so skip the int()/float() attempts and their
+    # raised exceptions
+    if not (value[0].isdecimal() or value[0] in NUMBER_LEAD_CHARS):
         return value
     
     # Try integer conversion
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from core import NormalizedRecord
 
-from .base import BaseNormalizer
+from .base import (
+    ISO_DATE_RE,
+    ISO_DATETIME_RE,
+    NULL_TOKENS,
+    NUMBER_LEAD_CHARS,
+    BaseNormalizer,
+)
+
+_INVALID_KEY_CHARS_RE = re.compile(r'[^a-z0-9_]')
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
 
 
 class KVNormalizer(BaseNormalizer):
@@ -23,6 +33,7 @@ class KVNormalizer(BaseNormalizer):
             List of NormalizedRecord objects with normalized data
         """
         normalized = []
+        append = normalized.append
         
         for record in records:
             # Extract data and metadata
@@ -41,7 +52,7 @@ class KVNormalizer(BaseNormalizer):
                     extraction_confidence=confidence,
                     provenance={"source": source_type}
                 )
-                normalized.append(norm_record)
+                append(norm_record)
         
         return normalized
 
@@ -58,18 +69,8 @@ def normalize_kv_record(record: Dict[str, str]) -> Optional[Dict]:
     if not record:
         return None
     
-    normalized = {}
-    
-    for key, value in record.items():
-        # Standardize key name
-        clean_key = _standardize_key(key)
-        
-        # Infer and convert value type
-        typed_value = infer_value_type(value)
-        
-        normalized[clean_key] = typed_value
-    
-    return normalized
+    # Standardized keys are memoized: KV blocks repeat the same labels
+    return {_standardize_key(key): infer_value_type(value) for key, value in record.items()}
 
 
 def infer_value_type(value: str) -> Any:
@@ -108,7 +109,7 @@ def infer_value_type(value: str) -> Any:
     
     # Null-like values (case-insensitive)
     value_lower = value.lower()
-    if value_lower in ("null", "none", "nil", "-", "n/a", "na", "n.a.", "n.a"):
+    if value_lower in NULL_TOKENS:
         return None
     
     # Boolean values (case-insensitive)
@@ -119,12 +120,18 @@ def infer_value_type(value: str) -> Any:
     
     # ISO date patterns - keep as strings (no parsing)
     # Pattern 1: YYYY-MM-DD
-    if re.match(r'^\d{4}-\d{2}-\d{2}$', value):
+    if ISO_DATE_RE.match(value):
         return value
     
     # Pattern 2: ISO 8601 datetime
     # YYYY-MM-DDTHH:MM:SS or with timezone/milliseconds
-    if re.match(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}', value):
+    if ISO_DATETIME_RE.match(value):
+        return value
+    
+    # Only a sign, digit, '.', or the start of inf/nan can begin a number;
+    # anything else is text, so skip the int()/float() attempts and their
+    # raised exceptions
+    if not (value[0].isdecimal() or value[0] in NUMBER_LEAD_CHARS):
         return value
     
     # Try integer conversion
@@ -161,6 +168,7 @@ def standardize_key_names(record: Dict) -> Dict:
     return {_standardize_key(k): v for k, v in record.items()}
 
 
+@lru_cache(maxsize=4096, typed=True)
 def _standardize_key(key: str) -> str:
     """Standardize a single key name.
     
@@ -187,10 +195,10 @@ def _standardize_key(key: str) -> str:
     key = key.replace(' ', '_').replace('-', '_')
     
     # Remove special characters except underscores and alphanumeric
-    key = re.sub(r'[^a-z0-9_]', '', key)
+    key = _INVALID_KEY_CHARS_RE.sub('', key)
     
     # Collapse multiple underscores
-    key = re.sub(r'_+', '_', key)
+    key = _UNDERSCORE_RUN_RE.sub('_', key)
     
     # Remove leading/trailing underscores
     key = key.strip('_')
@@ -107,17 +107,15 @@ def normalize_by_type(records: List[Dict], source_type: str) -> List[NormalizedR
     elif source_type == "yaml_block":
         # YAML is already structured, minimal normalization needed
         # Just convert to NormalizedRecord format
-        results = []
-        for record in records:
-            normalized_data = coerce_to_json_serializable(record.get("data", {}))
-            normalized = NormalizedRecord(
-                data=normalized_data,
+        return [
+            NormalizedRecord(
+                data=coerce_to_json_serializable(record.get("data", {})),
                 source_type="yaml_block",
                 extraction_confidence=record.get("confidence", 0.95),
                 provenance=record.get("metadata", {})
             )
-            results.append(normalized)
-        return results
+            for record in records
+        ]
     else:
         # Unknown source type - return empty list
         return []
@@ -1,7 +1,7 @@
 """Service layer exports."""
 
-from .pipeline_service import process_upload
+from .pipeline_service import process_upload, process_upload_bytes
 from .schema_service import get_current_schema
 from .query_service import execute_query
 
-__all__ = ["process_upload", "get_current_schema", "execute_query"]
+__all__ = ["process_upload", "process_upload_bytes", "get_current_schema", "execute_query"]
@@ -5,16 +5,26 @@ Provides named entity extraction using spaCy for the ETL pipeline.
 Extracts entities like PERSON, ORG, DATE, GPE, etc. from text fragments.
 """
 
-from typing import Dict, List, Optional
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Optional, Set
 import spacy
 
+from config import SPACY_MODEL_NAME
+
+# Only entity labels are used, so the components NER does not depend on are
+# left disabled rather than run on every document
+_UNUSED_PIPES = ["tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+# Number of fragment texts spaCy processes per batch in apply_ner_to_fragments
+_NER_BATCH_SIZE = 128
+
 # Load spaCy model once at module level for efficiency
 try:
-    nlp = spacy.load("en_core_web_sm")
+    nlp = spacy.load(SPACY_MODEL_NAME, disable=_UNUSED_PIPES)
 except OSError:
     raise RuntimeError(
-        "spaCy model 'en_core_web_sm' not found. "
-        "Please run: python -m spacy download en_core_web_sm"
+        f"spaCy model '{SPACY_MODEL_NAME}' not found. "
+        f"Please run: python -m spacy download {SPACY_MODEL_NAME}"
     )
 
 
@@ -40,31 +50,44 @@ def extract_entities_from_text(text: str) -> Dict[str, List[str]]:
         - Handles empty or None text safely
         - Common entity types: PERSON, ORG, GPE, DATE, MONEY, etc.
     """
-    # Handle empty or None text
-    if not text or not isinstance(text, str):
+    # Handle empty or None text; whitespace-only text has no entities either
+    if not text or not isinstance(text, str) or text.isspace():
         return {}
     
     # Process text with spaCy
-    doc = nlp(text)
-    
-    # Group entities by label
-    entities_by_label: Dict[str, List[str]] = {}
+    return _entities_from_doc(nlp(text))
+
+
+def _entities_from_doc(doc) -> Dict[str, List[str]]:
+    """Group a processed document's entities by label."""
+    # Collect into sets so duplicates are dropped as they are seen
+    entities_by_label: DefaultDict[str, Set[str]] = defaultdict(set)
     
     for ent in doc.ents:
-        label = ent.label_
-        entity_text = ent.text
-        
-        if label not in entities_by_label:
-            entities_by_label[label] = []
-        
-        entities_by_label[label].append(entity_text)
+        entities_by_label[ent.label_].add(ent.text)
     
-    # Deduplicate and sort each list for determinism
-    for label in entities_by_label:
-        # Convert to set for deduplication, then sort
-        entities_by_label[label] = sorted(list(set(entities_by_label[label])))
+    # Sort each label's entities for determinism
+    return {label: sorted(texts) for label, texts in entities_by_label.items()}
+
+
+def _fragment_text(fragment: Dict) -> Optional[str]:
+    """Return the text NER should run on, or None if there is nothing to process.
     
-    return entities_by_label
+    Prefers "raw_text" if the key exists, otherwise the stringified
+    "content" field.
+    """
+    text = None
+    if "raw_text" in fragment:
+        text = fragment["raw_text"]
+    elif "content" in fragment:
+        # Convert content to string if it exists
+        content = fragment["content"]
+        if content is not None:
+            text = str(content)
+    
+    if not text or not isinstance(text, str) or text.isspace():
+        return None
+    return text
 
 
 def apply_ner_to_fragment(fragment: Dict) -> Dict:
@@ -87,21 +110,9 @@ def apply_ner_to_fragment(fragment: Dict) -> Dict:
     # Create a copy to avoid modifying input
     result = fragment.copy()
     
-    # Extract text from fragment
-    text = None
-    if "raw_text" in fragment:
-        text = fragment["raw_text"]
-    elif "content" in fragment:
-        # Convert content to string if it exists
-        content = fragment["content"]
-        if content is not None:
-            text = str(content)
-    
     # Extract entities
-    entities = extract_entities_from_text(text) if text else {}
-    
-    # Add NER results to fragment
-    result["ner"] = entities
+    text = _fragment_text(fragment)
+    result["ner"] = extract_entities_from_text(text) if text else {}
     
     return result
 
@@ -121,6 +132,20 @@ def apply_ner_to_fragments(fragments: List[Dict]) -> List[Dict]:
         - Returns a new list (does not modify input in-place)
         - Deterministic output (entity lists are sorted)
         - Safe for empty or malformed fragments
+        - Texts are streamed through ``nlp.pipe`` in batches rather than
+          processed one call per fragment
     """
-    # Process each fragment and return new list
-    return [apply_ner_to_fragment(fragment) for fragment in fragments]
+    texts = [_fragment_text(fragment) for fragment in fragments]
+    docs = nlp.pipe(
+        (text for text in texts if text is not None),
+        batch_size=_NER_BATCH_SIZE,
+    )
+    
+    results = []
+    for fragment, text in zip(fragments, texts):
+        # Create a copy to avoid modifying input
+        result = fragment.copy()
+        result["ner"] = _entities_from_doc(next(docs)) if text is not None else {}
+        results.append(result)
+    
+    return results
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
-from core import NormalizedRecord, SchemaMetadata, TabularSchemaGroup, UploadResponse
+from pymongo.errors import PyMongoError
+
+from core import ExtractedRecord, NormalizedRecord, SchemaMetadata, TabularSchemaGroup, UploadResponse
 from core.constants import DEFAULT_BATCH_SIZE, SCHEMA_ID_TEMPLATE
 from core.exceptions import (
     ExtractionError,
@@ -14,7 +16,7 @@ from core.exceptions import (
     SchemaInferenceError,
     StorageError,
 )
-from extractors.orchestrator import extract_all_records
+from extractors.orchestrator import extract_all_records, extract_records_from_bytes
 from normalizers.orchestrator import normalize_all_records
 from services import orchestrator as service_orchestrator
 from services import schema_service
@@ -22,7 +24,7 @@ from services.ner_service import apply_ner_to_fragments
 from storage import collection_manager, document_inserter, schema_store
 from storage.connection import MongoConnection
 from storage.sqlite_connection import SQLiteConnection
-from storage.sqlite_table_manager import create_table_from_schema
+from storage.sqlite_table_manager import create_suggested_indexes, create_table_from_schema
 from storage.sqlite_document_inserter import batch_insert_documents_sqlite
 from storage.storage_router import categorize_records_by_storage, get_compatible_dbs_for_schema
 from storage.sqlite_db_locator import get_version_db_path
@@ -46,6 +48,43 @@ def process_upload(file_path: str, source_id: str, enable_ner: bool = True) -> U
     if not resolved_path.is_file():
         raise ExtractionError(f"File not found: {file_path}")
 
+    return _process_document(
+        lambda: extract_all_records(str(resolved_path)), file_path, source_id, enable_ner
+    )
+
+
+def process_upload_bytes(
+    content: Union[bytes, str],
+    source_id: str,
+    *,
+    filename_hint: str,
+    enable_ner: bool = True,
+) -> UploadResponse:
+    """Process upload content already held in memory, without a file round-trip.
+
+    Args:
+        content: File body; .txt/.md content may also be an already decoded str
+        source_id: Identifier for the data source
+        filename_hint: Original filename, whose extension selects the parser
+        enable_ner: Whether to apply Named Entity Recognition (default: True)
+    """
+
+    return _process_document(
+        lambda: extract_records_from_bytes(content, filename_hint),
+        filename_hint,
+        source_id,
+        enable_ner,
+    )
+
+
+def _process_document(
+    extract: Callable[[], Tuple[List[ExtractedRecord], Dict[str, int]]],
+    label: str,
+    source_id: str,
+    enable_ner: bool,
+) -> UploadResponse:
+    """Run extraction via ``extract`` and the rest of the pipeline for one upload."""
+
     file_id = uuid4().hex
     db_name = get_database_name(source_id)
     collection_name = get_collection_name(source_id)
@@ -57,14 +96,14 @@ def process_upload(file_path: str, source_id: str, enable_ner: bool = True) -> U
     evidence = {}
 
     try:
-        extracted_records, fragment_stats = extract_all_records(str(resolved_path))
+        extracted_records, fragment_stats = extract()
         evidence["extraction"] = {
             "status": "success",
             "fragments": fragment_stats,
             "total_records": len(extracted_records)
         }
     except Exception as exc:  # pragma: no cover - extractor errors bubbled
-        LOGGER.exception("Extraction failed for '%s': %s", file_path, exc)
+        LOGGER.exception("Extraction failed for '%s': %s", label, exc)
         evidence["extraction"] = {"status": "failed", "error": str(exc)}
         raise ExtractionError("Unable to extract records") from exc
 
@@ -138,9 +177,9 @@ def process_upload(file_path: str, source_id: str, enable_ner: bool = True) -> U
         existing_schema = None
 
     try:
-        new_schema = schema_service.compute_schema_for_source(normalized_records, source_id)
+        new_schema = schema_service.compute_schema_from_normalized(normalized_records, source_id)
         if sqlite_records:
-            sqlite_schema = schema_service.compute_schema_for_source(sqlite_records, source_id)
+            sqlite_schema = schema_service.compute_schema_from_normalized(sqlite_records, source_id)
         # Update compatible databases based on schema shape
         compatible_dbs = get_compatible_dbs_for_schema(new_schema, sqlite_schema)
         new_schema.compatible_dbs = compatible_dbs
@@ -192,9 +231,13 @@ def process_upload(file_path: str, source_id: str, enable_ner: bool = True) -> U
                 raise StorageError("Failed to prepare MongoDB collection")
 
         mongodb_docs = _serialize_normalized_records(mongodb_records)
-        valid_docs = _filter_valid_documents(mongodb_docs, active_schema)
         mongodb_inserted = document_inserter.batch_insert_documents(
-            db, collection_name, valid_docs, batch_size=DEFAULT_BATCH_SIZE
+            db,
+            collection_name,
+            mongodb_docs,
+            batch_size=DEFAULT_BATCH_SIZE,
+            schema=active_schema,
+            validation_mode=document_inserter.ValidationMode.CLIENT_ONLY,
         )
         LOGGER.info(f"Inserted {mongodb_inserted} records into MongoDB")
 
@@ -224,8 +267,17 @@ def process_upload(file_path: str, source_id: str, enable_ner: bool = True) -> U
                 plan.group.table_name,
                 plan.documents,
                 source_id,
+                fields=plan.group.fields,
             )
             sqlite_inserted += inserted_count
+            if not duplicate_upload:
+                # Build indexes after the bulk load instead of maintaining them per row.
+                create_suggested_indexes(
+                    sqlite_connection,
+                    db_path,
+                    plan.group.table_name,
+                    plan.group.fields,
+                )
             LOGGER.info(
                 "Inserted %d records into SQLite table '%s' (db=%s)",
                 inserted_count,
@@ -253,8 +305,10 @@ def process_upload(file_path: str, source_id: str, enable_ner: bool = True) -> U
 
     should_persist_schema = (not duplicate_upload) or (tabular_groups != [])
     if should_persist_schema:
-        if not schema_store.store_schema(db, prepared_schema):
-            raise StorageError("Failed to persist schema metadata")
+        try:
+            schema_store.store_schema(db, prepared_schema)
+        except PyMongoError as exc:
+            raise StorageError("Failed to persist schema metadata") from exc
 
     status = "success" if inserted > 0 else "noop"
     response_schema_id = active_schema.schema_id if active_schema else schema_id
@@ -292,15 +346,3 @@ def _serialize_normalized_records(records: List[NormalizedRecord]) -> List[Dict[
     for record in records:
         serialized.append(dict(record.data))
     return serialized
-
-
-def _filter_valid_documents(
-    docs: List[Dict[str, Any]], schema: Optional[SchemaMetadata]
-) -> List[Dict[str, Any]]:
-    if schema is None:
-        return docs
-    valid = []
-    for doc in docs:
-        if document_inserter.validate_document_for_insertion(doc, schema):
-            valid.append(doc)
-    return valid
@@ -8,12 +8,12 @@ from typing import Any, Dict, List, Optional, Sequence, Tuple
 from bson import ObjectId
 from pymongo.errors import PyMongoError
 
-from core import QueryResult, TabularSchemaGroup
+from core import QueryResult, SchemaMetadata, TabularSchemaGroup
 from core.exceptions import QueryExecutionError, SchemaInferenceError
 from services import orchestrator as service_orchestrator, schema_service
 from storage.connection import MongoConnection
 from storage.sqlite_connection import SQLiteConnection
-from storage.sqlite_table_manager import get_table_columns, table_exists
+from storage.sqlite_table_manager import get_table_columns
 from storage.sqlite_db_locator import get_version_db_path
 from utils.logger import get_logger
 
@@ -22,11 +22,48 @@ LOGGER = get_logger(__name__)
 DEFAULT_LIMIT = 100
 MAX_LIMIT = 1000
 SQLITE_SUPPORTED_OPERATORS = {"$eq", "$ne", "$gt", "$gte", "$lt", "$lte", "$in", "$like"}
+_SQLITE_COMPARISON_OPERATORS = {
+    "$eq": "=",
+    "$ne": "!=",
+    "$gt": ">",
+    "$gte": ">=",
+    "$lt": "<",
+    "$lte": "<=",
+}
 
 
 def execute_query(source_id: str, query: Dict[str, Any]) -> QueryResult:
     """Execute a strict query against MongoDB or SQLite based on the payload."""
 
+    engine, payload = _split_engine(query)
+    if engine == "sqlite":
+        return _execute_sqlite_query(source_id, payload)
+    return _execute_mongodb_query(source_id, payload)
+
+
+def execute_batch(source_id: str, queries: Sequence[Dict[str, Any]]) -> List[QueryResult]:
+    """Execute several strict queries against one source, returning results in order.
+
+    The source's schema is fetched at most once for all SQLite queries in the
+    batch instead of once per query.
+    """
+
+    results = []
+    schema: Optional[SchemaMetadata] = None
+    for query in queries:
+        engine, payload = _split_engine(query)
+        if engine == "sqlite":
+            if schema is None:
+                schema = _get_sqlite_schema(source_id)
+            results.append(_execute_sqlite_query(source_id, payload, schema))
+        else:
+            results.append(_execute_mongodb_query(source_id, payload))
+    return results
+
+
+def _split_engine(query: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """Validate a query payload and separate its engine from the rest."""
+
     if not isinstance(query, dict):
         raise QueryExecutionError("Query payload must be a dictionary")
 
@@ -35,15 +72,10 @@ def execute_query(source_id: str, query: Dict[str, Any]) -> QueryResult:
         raise QueryExecutionError("engine must be a string if provided")
 
     engine = engine_value.lower()
-    payload = {k: v for k, v in query.items() if k != "engine"}
-
-    if engine == "sqlite":
-        return _execute_sqlite_query(source_id, payload)
-
-    if engine != "mongodb":
+    if engine not in ("mongodb", "sqlite"):
         raise QueryExecutionError("Unsupported query engine. Use 'mongodb' or 'sqlite'.")
 
-    return _execute_mongodb_query(source_id, payload)
+    return engine, {k: v for k, v in query.items() if k != "engine"}
 
 
 def _execute_mongodb_query(source_id: str, query: Dict[str, Any]) -> QueryResult:
@@ -74,12 +106,21 @@ def _execute_mongodb_query(source_id: str, query: Dict[str, Any]) -> QueryResult
     )
 
 
-def _execute_sqlite_query(source_id: str, query: Dict[str, Any]) -> QueryResult:
+def _get_sqlite_schema(source_id: str) -> SchemaMetadata:
     try:
-        schema = schema_service.get_current_schema(source_id)
+        return schema_service.get_current_schema(source_id)
     except SchemaInferenceError as exc:
         raise QueryExecutionError(str(exc)) from exc
 
+
+def _execute_sqlite_query(
+    source_id: str,
+    query: Dict[str, Any],
+    schema: Optional[SchemaMetadata] = None,
+) -> QueryResult:
+    if schema is None:
+        schema = _get_sqlite_schema(source_id)
+
     if "sqlite" not in (schema.compatible_dbs or []):
         raise QueryExecutionError("Source is not stored in SQLite.")
     if not schema.tabular_groups:
@@ -89,10 +130,12 @@ def _execute_sqlite_query(source_id: str, query: Dict[str, Any]) -> QueryResult:
     table_name = table_metadata.table_name
     db_path = get_version_db_path(source_id, schema.version)
     conn = SQLiteConnection.get_instance()
-    if not table_exists(conn, db_path, table_name):
+    # PRAGMA table_info returns no rows for a missing table, so one catalog
+    # lookup both checks existence and yields the columns
+    columns = get_table_columns(conn, db_path, table_name)
+    if not columns:
         raise QueryExecutionError("SQLite table for source does not exist.")
 
-    columns = get_table_columns(conn, db_path, table_name)
     select_clause = _build_select_clause(query.get("select"), columns)
     where_clause, params = _build_where_clause(query.get("where"), columns)
     order_clause = _build_order_by_clause(query.get("order_by"), columns)
@@ -256,15 +299,7 @@ def _render_operator(column: str, operator: str, value: Any) -> Tuple[str, List[
             raise QueryExecutionError("$like value must be a string")
         return f"{column} LIKE ?", [value]
 
-    operator_map = {
-        "$eq": "=",
-        "$ne": "!=",
-        "$gt": ">",
-        "$gte": ">=",
-        "$lt": "<",
-        "$lte": "<=",
-    }
-    sql_operator = operator_map.get(operator)
+    sql_operator = _SQLITE_COMPARISON_OPERATORS.get(operator)
     if not sql_operator:
         raise QueryExecutionError(f"Unsupported operator '{operator}' for SQLite queries")
     return f"{column} {sql_operator} ?", [value]
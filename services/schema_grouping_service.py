@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from hashlib import sha1
-from typing import Any, Dict, Iterable, List, Set
+from typing import Any, Dict, FrozenSet, Iterable, List, Set, Tuple
 
 from core import SchemaField, TabularSchemaGroup
 from utils.logger import get_logger
@@ -88,44 +88,51 @@ class _GroupingBucket:
         self.documents: List[Dict[str, Any]] = []
         self.field_names: Set[str] = set()
         self.ner_labels: Set[str] = set()
-
-    def is_compatible(self, fields: Set[str], ner_labels: Set[str]) -> bool:
-        field_score = _jaccard(self.field_names, fields)
-        ner_score = _jaccard(self.ner_labels, ner_labels)
-        return field_score >= FIELD_SIMILARITY_THRESHOLD and ner_score >= NER_SIMILARITY_THRESHOLD
+        # Verdicts by (field names, NER labels) fingerprint; valid only while
+        # this bucket's own field and label sets are unchanged
+        self._verdicts: Dict[Tuple[FrozenSet[str], FrozenSet[str]], bool] = {}
+
+    def is_compatible(self, fields: FrozenSet[str], ner_labels: FrozenSet[str]) -> bool:
+        fingerprint = (fields, ner_labels)
+        verdict = self._verdicts.get(fingerprint)
+        if verdict is None:
+            field_score = _jaccard(self.field_names, fields)
+            ner_score = _jaccard(self.ner_labels, ner_labels)
+            verdict = field_score >= FIELD_SIMILARITY_THRESHOLD and ner_score >= NER_SIMILARITY_THRESHOLD
+            self._verdicts[fingerprint] = verdict
+        return verdict
 
     def add_document(
         self,
         doc: Dict[str, Any],
-        fields: Set[str],
-        ner_labels: Set[str],
+        fields: FrozenSet[str],
+        ner_labels: FrozenSet[str],
     ) -> None:
         self.documents.append(doc)
+        if fields <= self.field_names and ner_labels <= self.ner_labels:
+            return
         self.field_names.update(fields)
         self.ner_labels.update(ner_labels)
+        self._verdicts.clear()
 
 
-def _extract_field_names(doc: Dict[str, Any]) -> Set[str]:
-    fields: Set[str] = set()
-    for key in doc.keys():
-        if key in _EXCLUDED_COLUMNS or key.startswith("_"):
-            continue
-        fields.add(str(key))
-    return fields
+def _extract_field_names(doc: Dict[str, Any]) -> FrozenSet[str]:
+    return frozenset(
+        str(key)
+        for key in doc.keys()
+        if key not in _EXCLUDED_COLUMNS and not key.startswith("_")
+    )
 
 
-def _extract_ner_labels(doc: Dict[str, Any]) -> Set[str]:
+def _extract_ner_labels(doc: Dict[str, Any]) -> FrozenSet[str]:
     ner_payload = doc.get("ner")
     if not isinstance(ner_payload, dict):
-        return set()
-    labels: Set[str] = set()
-    for label, values in ner_payload.items():
-        if not isinstance(label, str):
-            continue
-        if isinstance(values, list) and not values:
-            continue
-        labels.add(label)
-    return labels
+        return frozenset()
+    return frozenset(
+        label
+        for label, values in ner_payload.items()
+        if isinstance(label, str) and not (isinstance(values, list) and not values)
+    )
 
 
 def _infer_schema_fields(documents: List[Dict[str, Any]]) -> List[SchemaField]:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Union, cast
 
 from core import GetSchemaHistoryResponse, NormalizedRecord, SchemaMetadata
@@ -15,6 +16,7 @@ from utils.logger import get_logger
 
 
 LOGGER = get_logger(__name__)
+_RECORD_DATA = attrgetter("data")
 
 
 def _get_db_for_source(source_id: str):
@@ -74,37 +76,45 @@ def compute_schema_for_source(
         For full schema lifecycle management, use the higher-level
         pipeline orchestrators that call this function.
     """
-    # Normalize input: extract data from NormalizedRecord objects
-    records: List[Dict[str, Any]] = []
-    
     if not fragments:
-        # Empty input, pass empty list to generator
-        records = []
-    elif isinstance(fragments[0], NormalizedRecord):
-        # Extract .data from each NormalizedRecord
-        normalized = cast(List[NormalizedRecord], fragments)
-        records = [frag.data for frag in normalized]
-    elif isinstance(fragments[0], dict):
-        # Already in dict format
-        records = cast(List[Dict[str, Any]], fragments)
-    else:
-        # Unknown type, try to coerce
-        coerced: List[Dict[str, Any]] = []
-        for frag in fragments:
-            if hasattr(frag, "dict"):
-                coerced.append(getattr(frag, "dict")())
-            elif hasattr(frag, "__dict__"):
-                coerced.append(dict(getattr(frag, "__dict__")))
-            elif isinstance(frag, dict):
-                coerced.append(frag)
-            else:
-                coerced.append({"value": frag})
-        records = coerced
-    
-    # Delegate to schema generator
+        return compute_schema_from_records([], source_id)
+
+    first = fragments[0]
+    if isinstance(first, NormalizedRecord):
+        return compute_schema_from_normalized(cast(List[NormalizedRecord], fragments), source_id)
+    if isinstance(first, dict):
+        return compute_schema_from_records(cast(List[Dict[str, Any]], fragments), source_id)
+
+    # Unknown type, try to coerce
+    return compute_schema_from_records([_coerce_fragment(frag) for frag in fragments], source_id)
+
+
+def compute_schema_from_records(
+    records: List[Dict[str, Any]], source_id: str
+) -> SchemaMetadata:
+    """Compute schema for already-extracted dict payloads."""
+
     return generate_schema(records, source_id)
 
 
+def compute_schema_from_normalized(
+    fragments: List[NormalizedRecord], source_id: str
+) -> SchemaMetadata:
+    """Compute schema for NormalizedRecord objects from the normalization pipeline."""
+
+    return generate_schema(list(map(_RECORD_DATA, fragments)), source_id)
+
+
+def _coerce_fragment(frag: Any) -> Dict[str, Any]:
+    if isinstance(frag, dict):
+        return frag
+    if hasattr(frag, "dict"):
+        return getattr(frag, "dict")()
+    if hasattr(frag, "__dict__"):
+        return dict(getattr(frag, "__dict__"))
+    return {"value": frag}
+
+
 def get_current_schema(source_id: str) -> SchemaMetadata:
     """Return the latest schema for a source."""
 
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable
+import time
+from enum import Enum
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, Iterable, Optional, Set, Tuple
 
+from pymongo import ASCENDING, IndexModel
 from pymongo.errors import PyMongoError
+from pymongo.write_concern import WriteConcern
 
 from core import SchemaMetadata
 from utils.logger import get_logger
@@ -13,23 +19,89 @@ from utils.logger import get_logger
 _LOGGER = get_logger(__name__)
 
 
+class BsonType(str, Enum):
+    """Canonical BSON types used by collection validators."""
+
+    STRING = "string"
+    INT = "int"
+    DOUBLE = "double"
+    BOOL = "bool"
+    DATE = "date"
+    OBJECT = "object"
+    ARRAY = "array"
+
+
 _TYPE_MAPPING = {
-    "string": "string",
-    "int": "int",
-    "integer": "int",
-    "float": "double",
-    "double": "double",
-    "number": "double",
-    "bool": "bool",
-    "boolean": "bool",
-    "datetime": "date",
-    "object": "object",
-    "array": "array",
+    "string": BsonType.STRING,
+    "int": BsonType.INT,
+    "integer": BsonType.INT,
+    "float": BsonType.DOUBLE,
+    "double": BsonType.DOUBLE,
+    "number": BsonType.DOUBLE,
+    "bool": BsonType.BOOL,
+    "boolean": BsonType.BOOL,
+    "datetime": BsonType.DATE,
+    "object": BsonType.OBJECT,
+    "array": BsonType.ARRAY,
 }
 
 
+# Known collection names per (client, database), refreshed after a short TTL.
+_COLLECTION_CACHE_TTL_SECONDS = 5.0
+_COLLECTION_CACHE: Dict[Tuple[int, str], Tuple[float, Set[str]]] = {}
+_COLLECTION_CACHE_LOCK = Lock()
+# Validators are keyed by (schema_id, version, field signature); size to the
+# number of distinct schema versions synced by one process.
+_VALIDATOR_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def resolve_bson_type(field_type: Optional[str]) -> BsonType:
+    """Resolve a schema field type to its canonical BSON type.
+
+    Schemas reuse a handful of type strings, so caching on the raw value means
+    each distinct spelling is lowered and looked up only once per process.
+    """
+
+    return _TYPE_MAPPING.get(field_type.lower(), BsonType.STRING) if field_type else BsonType.STRING
+
+
 def _map_schema_type(field_type: str) -> str:
-    return _TYPE_MAPPING.get(field_type.lower(), "string") if field_type else "string"
+    return resolve_bson_type(field_type).value
+
+
+def _collection_cache_key(db) -> Tuple[int, str]:
+    return (id(db.client), db.name)
+
+
+def _remember_collection(db, name: str) -> None:
+    key = _collection_cache_key(db)
+    now = time.monotonic()
+    with _COLLECTION_CACHE_LOCK:
+        cached = _COLLECTION_CACHE.get(key)
+        if cached is None or now - cached[0] >= _COLLECTION_CACHE_TTL_SECONDS:
+            _COLLECTION_CACHE[key] = (now, {name})
+        else:
+            cached[1].add(name)
+
+
+def _collection_exists(db, name: str) -> bool:
+    """Check for a collection, reusing recent answers instead of listing namespaces."""
+
+    key = _collection_cache_key(db)
+    with _COLLECTION_CACHE_LOCK:
+        cached = _COLLECTION_CACHE.get(key)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < _COLLECTION_CACHE_TTL_SECONDS
+            and name in cached[1]
+        ):
+            return True
+
+    exists = name in db.list_collection_names(filter={"name": name})
+    if exists:
+        _remember_collection(db, name)
+    return exists
 
 
 def create_collection_from_schema(db, name: str, schema: SchemaMetadata) -> bool:
@@ -38,8 +110,9 @@ def create_collection_from_schema(db, name: str, schema: SchemaMetadata) -> bool
     validator = build_mongo_validation_schema(schema)
     try:
         # Ensure collection exists with the expected validator.
-        if name not in db.list_collection_names():
+        if not _collection_exists(db, name):
             db.create_collection(name, validator=validator)
+            _remember_collection(db, name)
         else:
             db.command("collMod", name, validator=validator)
 
@@ -52,14 +125,32 @@ def create_collection_from_schema(db, name: str, schema: SchemaMetadata) -> bool
 
 
 def build_mongo_validation_schema(schema: SchemaMetadata) -> Dict:
-    """Build Mongo validation rules from SchemaMetadata."""
-
+    """Build Mongo validation rules from SchemaMetadata.
+
+    The result is cached per schema signature and shared between callers, so
+    treat it as read-only.
+    """
+
+    fields_sig = tuple(
+        (
+            field.name,
+            field.type,
+            f"example: {field.example_value}" if field.example_value is not None else None,
+        )
+        for field in schema.fields
+    )
+    return _validator_for(schema.schema_id, schema.version, fields_sig)
+
+
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
+def _validator_for(
+    schema_id: str, schema_version: int, fields_sig: Tuple[Tuple[str, str, Optional[str]], ...]
+) -> Dict:
     properties = {}
-    for field in schema.fields:
-        bson_type = _map_schema_type(field.type)
-        properties[field.name] = {"bsonType": bson_type}
-        if field.example_value is not None:
-            properties[field.name]["description"] = f"example: {field.example_value}"
+    for name, field_type, description in fields_sig:
+        properties[name] = {"bsonType": _map_schema_type(field_type)}
+        if description is not None:
+            properties[name]["description"] = description
 
     # Allow optional fields but still validate known ones when present.
     return {
@@ -72,25 +163,62 @@ def build_mongo_validation_schema(schema: SchemaMetadata) -> Dict:
 
 
 def create_indexes(db, name: str, field_names: Iterable[str]):
-    """Create indexes for frequently queried fields."""
+    """Create indexes for frequently queried fields in a single command."""
 
     collection = db[name]
-    for field_name in field_names:
-        if not field_name or field_name == "_id":
-            continue
+    models = [
+        IndexModel([(field_name, ASCENDING)], background=True)
+        for field_name in field_names
+        if field_name and field_name != "_id"
+    ]
+    if not models:
+        return
+
+    try:
+        collection.create_indexes(models)
+        return
+    except PyMongoError as exc:
+        details = getattr(exc, "details", None) or {}
+        _LOGGER.warning(
+            "Batched index creation on '%s' failed (%s); retrying per field: %s",
+            name,
+            details.get("codeName", "unknown"),
+            exc,
+        )
+
+    # Fall back to one index at a time so a single bad field does not block the rest.
+    for model in models:
+        keys = model.document["key"]
         try:
-            collection.create_index([(field_name, 1)], background=True)
+            collection.create_indexes([model])
         except PyMongoError as exc:
-            _LOGGER.warning("Skipping index on '%s.%s': %s", name, field_name, exc)
+            _LOGGER.warning("Skipping index on '%s.%s': %s", name, next(iter(keys)), exc)
 
 
-def alter_collection_add_field(db, name: str, field_name: str, field_type: str) -> bool:
-    """Add a new field to an existing collection."""
+def alter_collection_add_field(
+    db, name: str, field_name: str, field_type: str, backfill: bool = False
+) -> bool:
+    """Add a new field to an existing collection.
 
-    collection = db[name]
+    Missing fields already read as null (e.g. ``{"$ifNull": ["$field", None]}``
+    in aggregations), so existing documents are only rewritten when
+    ``backfill`` is requested.
+    """
+
+    if not backfill:
+        _LOGGER.info(
+            "Registered field '%s' (%s) on '%s' without backfill", field_name, field_type, name
+        )
+        return True
+
+    collection = db[name].with_options(write_concern=WriteConcern(w=1))
     try:
-        # Ensure existing documents have the field so reads stay consistent.
-        collection.update_many({field_name: {"$exists": False}}, {"$set": {field_name: None}})
+        # Walk the _id index so the rewrite proceeds in insertion order.
+        collection.update_many(
+            {field_name: {"$exists": False}},
+            {"$set": {field_name: None}},
+            hint=[("_id", ASCENDING)],
+        )
         return True
     except PyMongoError as exc:
         _LOGGER.error("Failed to add field '%s' to '%s': %s", field_name, name, exc)
@@ -3,18 +3,30 @@
 from __future__ import annotations
 
 from threading import Lock
-from typing import Optional
+from typing import Dict, Optional, Union
 
 from pymongo import MongoClient
 
 from config import get_settings
 
 
+def _parse_write_concern(value: str) -> Union[int, str]:
+    """Allow numeric write concerns (``"1"``) alongside tags like ``"majority"``."""
+
+    return int(value) if value.isdigit() else value
+
+
 class MongoConnection:
     """Singleton-style MongoDB connection helper."""
 
     _instance: Optional["MongoConnection"] = None
     _lock: Lock = Lock()
+    # One MongoClient per URI: each client owns monitor threads and a socket pool.
+    # The holder count lets disconnect() close a client only once the last
+    # connection using it lets go.
+    _clients: Dict[str, MongoClient] = {}
+    _client_holders: Dict[str, int] = {}
+    _clients_lock: Lock = Lock()
 
     def __init__(self, uri: Optional[str] = None) -> None:
         self._settings = get_settings()
@@ -22,18 +34,55 @@ class MongoConnection:
         self._client: Optional[MongoClient] = None
 
     def connect(self) -> MongoClient:
-        """Establish a new Mongo client."""
+        """Establish a new Mongo client, or reuse the one already open for this URI."""
 
-        if self._client is None:
-            self._client = MongoClient(self._uri)
+        if self._client is not None:
+            return self._client
+
+        with MongoConnection._clients_lock:
+            if self._client is None:
+                client = MongoConnection._clients.get(self._uri)
+                if client is None:
+                    client = self._create_client()
+                    MongoConnection._clients[self._uri] = client
+                holders = MongoConnection._client_holders
+                holders[self._uri] = holders.get(self._uri, 0) + 1
+                self._client = client
         return self._client
 
-    def disconnect(self) -> None:
-        """Close the Mongo client if present."""
+    def _create_client(self) -> MongoClient:
+        settings = self._settings
+        options = {
+            "maxPoolSize": settings.mongodb_pool_size,
+            "minPoolSize": settings.mongodb_min_pool_size,
+            "maxIdleTimeMS": settings.mongodb_max_idle_time_ms,
+            "serverSelectionTimeoutMS": settings.mongodb_server_selection_timeout_ms,
+            "socketTimeoutMS": settings.mongodb_socket_timeout_ms,
+            "compressors": settings.mongodb_compressors or None,
+        }
+        if settings.mongodb_write_concern:
+            options["w"] = _parse_write_concern(settings.mongodb_write_concern)
+        # Only settings configured through ETL_MONGODB_* override driver defaults
+        return MongoClient(
+            self._uri,
+            **{key: value for key, value in options.items() if value is not None},
+        )
 
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+    def disconnect(self) -> None:
+        """Release this connection's client, closing it once no other holder remains."""
+
+        with MongoConnection._clients_lock:
+            client, self._client = self._client, None
+            if client is None:
+                return
+            if MongoConnection._clients.get(self._uri) is client:
+                holders = MongoConnection._client_holders[self._uri] - 1
+                if holders:
+                    MongoConnection._client_holders[self._uri] = holders
+                    return
+                del MongoConnection._clients[self._uri]
+                del MongoConnection._client_holders[self._uri]
+            client.close()
 
     def get_client(self) -> MongoClient:
         """Return the active Mongo client, connecting if necessary."""
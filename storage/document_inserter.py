@@ -2,77 +2,175 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
-from pymongo.errors import PyMongoError
+from pymongo.errors import BulkWriteError, PyMongoError
 
 from core import SchemaMetadata
+from core.constants import DEFAULT_BATCH_SIZE
+from storage.collection_manager import BsonType, resolve_bson_type
 from utils.logger import get_logger
 
 
 _LOGGER = get_logger(__name__)
 
 
+def _check_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _check_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _check_bool(value) -> bool:
+    return isinstance(value, bool)
+
+
+def _check_datetime(value) -> bool:
+    return isinstance(value, datetime) or (isinstance(value, str) and value.endswith("Z"))
+
+
+def _check_object(value) -> bool:
+    return isinstance(value, dict)
+
+
+def _check_array(value) -> bool:
+    return isinstance(value, list)
+
+
+def _check_string(value) -> bool:
+    return isinstance(value, str)
+
+
+_TYPE_CHECKERS: Dict[BsonType, Callable[[Any], bool]] = {
+    BsonType.INT: _check_int,
+    BsonType.DOUBLE: _check_number,
+    BsonType.BOOL: _check_bool,
+    BsonType.DATE: _check_datetime,
+    BsonType.OBJECT: _check_object,
+    BsonType.ARRAY: _check_array,
+    BsonType.STRING: _check_string,
+}
+
+
+# Exact runtime types each checker accepts. Matching ``type(value)`` against
+# these is a single set lookup; subclasses still fall through to the checker.
+_EXACT_TYPES: Dict[Callable[[Any], bool], FrozenSet[type]] = {
+    _check_int: frozenset({int}),
+    _check_number: frozenset({int, float}),
+    _check_bool: frozenset({bool}),
+    _check_datetime: frozenset({datetime}),
+    _check_object: frozenset({dict}),
+    _check_array: frozenset({list}),
+    _check_string: frozenset({str}),
+}
+_NONE_TYPE = type(None)
+
+
+def _type_checker(expected: str) -> Callable[[Any], bool]:
+    return _TYPE_CHECKERS[resolve_bson_type(expected)]
+
+
 def _is_valid_type(value, expected: str) -> bool:
     if value is None:
         return True
+    return _type_checker(expected)(value)
 
-    expected = (expected or "").lower()
-
-    if expected in {"int", "integer"}:
-        return isinstance(value, int) and not isinstance(value, bool)
-    if expected in {"float", "double", "number"}:
-        return isinstance(value, (int, float)) and not isinstance(value, bool)
-    if expected in {"bool", "boolean"}:
-        return isinstance(value, bool)
-    if expected in {"datetime"}:
-        from datetime import datetime
-
-        return isinstance(value, datetime) or (
-            isinstance(value, str) and value.endswith("Z")
-        )
-    if expected in {"object"}:
-        return isinstance(value, dict)
-    if expected in {"array"}:
-        return isinstance(value, list)
-    return isinstance(value, str)
+
+class ValidationMode(str, Enum):
+    """Which layer validates documents during a batch insert."""
+
+    CLIENT_ONLY = "client_only"
+    SERVER_ONLY = "server_only"
+
+
+CLIENT_VALIDATION_THRESHOLD = 1000
 
 
 def insert_documents(db, name: str, docs: List[Dict]) -> int:
-    """Insert documents sequentially."""
+    """Insert documents with a single unordered bulk write per batch."""
 
     if not docs:
         return 0
 
-    collection = db[name]
-    inserted = 0
-    for doc in docs:
-        try:
-            collection.insert_one(doc)
-            inserted += 1
-        except PyMongoError as exc:
-            _LOGGER.error("Failed to insert document into '%s': %s", name, exc)
-    return inserted
+    return batch_insert_documents(db, name, docs, batch_size=len(docs))
 
 
 def batch_insert_documents(
-    db, name: str, docs: List[Dict], batch_size: int = 100
+    db,
+    name: str,
+    docs: List[Dict],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    pre_validated: bool = False,
+    schema: Optional[SchemaMetadata] = None,
+    validation_mode: Optional[ValidationMode] = None,
 ) -> int:
-    """Insert documents in batches for efficiency."""
+    """Insert documents in batches for efficiency.
+
+    When ``pre_validated`` is set the caller has already checked every
+    document with ``validate_document_for_insertion``, so the collection's
+    ``$jsonSchema`` validator is bypassed instead of re-running server-side.
+    Splitting batches at the 48MB wire-message limit is left to the driver.
+
+    Passing ``schema`` lets this function pick the validation layer itself so
+    each document is validated exactly once: ``CLIENT_ONLY`` filters locally
+    and bypasses the server validator, ``SERVER_ONLY`` leaves it to mongod.
+    Without an explicit ``validation_mode``, batches larger than
+    ``CLIENT_VALIDATION_THRESHOLD`` validate client-side, since that work
+    does not hold the collection write lock.
+
+    ``pre_validated`` takes precedence: validation is treated as already done,
+    so ``schema`` and ``validation_mode`` are ignored and nothing is filtered
+    or re-checked.
+    """
 
     if not docs:
         return 0
 
+    if schema is not None and not pre_validated:
+        if validation_mode is None:
+            validation_mode = (
+                ValidationMode.CLIENT_ONLY
+                if len(docs) > CLIENT_VALIDATION_THRESHOLD
+                else ValidationMode.SERVER_ONLY
+            )
+        if validation_mode is ValidationMode.CLIENT_ONLY:
+            validator = build_validator(schema)
+            docs = [doc for doc in docs if validator(doc)]
+            pre_validated = True
+            if not docs:
+                return 0
+        else:
+            pre_validated = False
+
     if batch_size <= 0:
-        batch_size = 100
+        batch_size = DEFAULT_BATCH_SIZE
 
     collection = db[name]
     total_inserted = 0
     for start in range(0, len(docs), batch_size):
         chunk = docs[start : start + batch_size]
         try:
-            result = collection.insert_many(chunk, ordered=False)
+            result = collection.insert_many(
+                chunk,
+                ordered=False,
+                bypass_document_validation=pre_validated,
+            )
             total_inserted += len(result.inserted_ids)
+        except BulkWriteError as exc:
+            # Unordered writes keep going past bad documents; keep the partial count.
+            inserted = exc.details.get("nInserted", 0)
+            total_inserted += inserted
+            _LOGGER.error(
+                "Partially inserted batch into '%s' (%d/%d): %s",
+                name,
+                inserted,
+                len(chunk),
+                exc,
+            )
         except PyMongoError as exc:
             _LOGGER.error(
                 "Failed to insert batch into '%s' (size=%d): %s",
@@ -83,21 +181,38 @@ def batch_insert_documents(
     return total_inserted
 
 
-def validate_document_for_insertion(doc: Dict, schema: SchemaMetadata) -> bool:
-    """Ensure documents comply with schema prior to insertion."""
+def build_validator(schema: SchemaMetadata) -> Callable[[Dict], bool]:
+    """Return a document validator with per-field type checks resolved up front.
 
-    if not isinstance(doc, dict):
-        return False
+    Use this instead of ``validate_document_for_insertion`` when checking many
+    documents against the same schema.
+    """
 
-    schema_fields = {field.name: field for field in schema.fields}
-    for key, value in doc.items():
-        if key == "_id":
-            continue
-        field = schema_fields.get(key)
-        if field is None:
-            _LOGGER.warning("Document contains unknown field '%s'", key)
-            return False
-        if not _is_valid_type(value, field.type):
-            _LOGGER.warning("Field '%s' failed type validation (expected %s)", key, field.type)
+    checkers = {}
+    for field in schema.fields:
+        checker = _type_checker(field.type)
+        checkers[field.name] = (field.type, _EXACT_TYPES[checker] | {_NONE_TYPE}, checker)
+
+    def _validate(doc: Dict) -> bool:
+        if not isinstance(doc, dict):
             return False
-    return True
+
+        for key, value in doc.items():
+            if key == "_id":
+                continue
+            entry = checkers.get(key)
+            if entry is None:
+                _LOGGER.warning("Document contains unknown field '%s'", key)
+                return False
+            if type(value) not in entry[1] and not entry[2](value):
+                _LOGGER.warning("Field '%s' failed type validation (expected %s)", key, entry[0])
+                return False
+        return True
+
+    return _validate
+
+
+def validate_document_for_insertion(doc: Dict, schema: SchemaMetadata) -> bool:
+    """Ensure documents comply with schema prior to insertion."""
+
+    return build_validator(schema)(doc)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from bson import ObjectId
 from pymongo.errors import PyMongoError
@@ -13,19 +13,33 @@ from utils.logger import get_logger
 _LOGGER = get_logger(__name__)
 
 
-def get_documents(
-    db, name: str, limit: int = 100, filter_query: Optional[Dict] = None
-) -> List[Dict]:
-    """Fetch a limited set of documents."""
+_DEFAULT_CURSOR_BATCH_SIZE = 1000
+
+
+def iter_documents(
+    db,
+    name: str,
+    limit: int = 100,
+    filter_query: Optional[Dict] = None,
+    batch_size: int = _DEFAULT_CURSOR_BATCH_SIZE,
+) -> Iterator[Dict]:
+    """Stream a limited set of documents without materializing them all."""
 
     collection = db[name]
     query = filter_query or {}
     try:
-        cursor = collection.find(query).limit(max(limit, 0))
-        return list(cursor)
+        cursor = collection.find(query).limit(max(limit, 0)).batch_size(max(batch_size, 1))
+        yield from cursor
     except PyMongoError as exc:
         _LOGGER.error("Failed to retrieve documents from '%s': %s", name, exc)
-        return []
+
+
+def get_documents(
+    db, name: str, limit: int = 100, filter_query: Optional[Dict] = None
+) -> List[Dict]:
+    """Fetch a limited set of documents."""
+
+    return list(iter_documents(db, name, limit, filter_query))
 
 
 def count_documents(db, name: str, filter_query: Optional[Dict] = None) -> int:
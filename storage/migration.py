@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Dict, List
 
+from pymongo import UpdateMany
 from pymongo.errors import PyMongoError
 
 from core import SchemaDiff, SchemaMetadata
@@ -16,12 +17,18 @@ _LOGGER = get_logger(__name__)
 def detect_schema_change(old: SchemaMetadata, new: SchemaMetadata) -> SchemaDiff:
     """Compare schemas and produce a diff."""
 
-    old_fields = {field.name: field for field in old.fields}
-    new_fields = {field.name: field for field in new.fields}
+    old_types = {field.name: field.type for field in old.fields}
+    old_names = sorted(old_types)
+    new_names = sorted(field.name for field in new.fields)
 
-    added = find_added_fields(list(old_fields.keys()), list(new_fields.keys()))
-    removed = find_removed_fields(list(old_fields.keys()), list(new_fields.keys()))
-    type_changes = find_type_changes(old, new)
+    added = _sorted_diff(new_names, old_names)
+    removed = _sorted_diff(old_names, new_names)
+
+    type_changes: Dict[str, Dict[str, str]] = {}
+    for field in new.fields:
+        old_type = old_types.get(field.name)
+        if old_type and old_type != field.type:
+            type_changes[field.name] = {"old": old_type, "new": field.type}
 
     notes: List[str] = []
     if added:
@@ -39,16 +46,33 @@ def detect_schema_change(old: SchemaMetadata, new: SchemaMetadata) -> SchemaDiff
     )
 
 
+def _sorted_diff(left: List[str], right: List[str]) -> List[str]:
+    """Return items of sorted ``left`` missing from sorted ``right`` in one linear pass."""
+
+    result: List[str] = []
+    j = 0
+    right_len = len(right)
+    for item in left:
+        while j < right_len and right[j] < item:
+            j += 1
+        if j < right_len and right[j] == item:
+            continue
+        if result and result[-1] == item:
+            continue
+        result.append(item)
+    return result
+
+
 def find_added_fields(old_fields: List[str], new_fields: List[str]) -> List[str]:
     """Return newly added fields."""
 
-    return sorted(set(new_fields) - set(old_fields))
+    return _sorted_diff(sorted(new_fields), sorted(old_fields))
 
 
 def find_removed_fields(old_fields: List[str], new_fields: List[str]) -> List[str]:
     """Return removed fields."""
 
-    return sorted(set(old_fields) - set(new_fields))
+    return _sorted_diff(sorted(old_fields), sorted(new_fields))
 
 
 def find_type_changes(
@@ -66,24 +90,45 @@ def find_type_changes(
 
 
 def evolve_collection_schema(
-    db, name: str, old_schema: SchemaMetadata, new_schema: SchemaMetadata
+    db,
+    name: str,
+    old_schema: SchemaMetadata,
+    new_schema: SchemaMetadata,
+    backfill: bool = False,
 ) -> bool:
-    """Apply schema evolution operations."""
+    """Apply schema evolution operations.
+
+    Missing fields already read as null, so added fields only rewrite
+    existing documents when ``backfill`` is requested.
+    """
 
     diff = detect_schema_change(old_schema, new_schema)
     if not diff.added_fields and not diff.type_changes:
         return True
 
-    collection = db[name]
-
-    try:
-        for field_name in diff.added_fields:
-            collection.update_many({field_name: {"$exists": False}}, {"$set": {field_name: None}})
+    ops: List[UpdateMany] = []
+    if diff.added_fields and backfill:
+        # One pass over the collection: a pipeline update fills every missing
+        # field with null while $ifNull leaves existing values untouched.
+        ops.append(
+            UpdateMany(
+                {"$or": [{field_name: {"$exists": False}} for field_name in diff.added_fields]},
+                [
+                    {
+                        "$set": {
+                            field_name: {"$ifNull": [f"${field_name}", None]}
+                            for field_name in diff.added_fields
+                        }
+                    }
+                ],
+            )
+        )
 
-        for field_name, change in diff.type_changes.items():
-            # Basic strategy: coerce incompatible types by moving values to a fallback field
-            fallback_field = f"{field_name}_legacy"
-            collection.update_many(
+    for field_name, change in diff.type_changes.items():
+        # Basic strategy: coerce incompatible types by moving values to a fallback field
+        fallback_field = f"{field_name}_legacy"
+        ops.append(
+            UpdateMany(
                 {
                     field_name: {
                         "$type": "string" if change["old"] == "string" else "missing",
@@ -93,6 +138,14 @@ def evolve_collection_schema(
                     "$set": {fallback_field: f"type-migrated from {change['old']}"},
                 },
             )
+        )
+
+    if not ops:
+        _LOGGER.info("Registered fields %s on '%s' without backfill", diff.added_fields, name)
+        return True
+
+    try:
+        db[name].bulk_write(ops, ordered=False)
         return True
     except PyMongoError as exc:
         _LOGGER.error("Failed to evolve collection '%s': %s", name, exc)
@@ -2,42 +2,108 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import hashlib
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Set
+from weakref import WeakKeyDictionary
 
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from pymongo.errors import PyMongoError
 
 from core import SchemaMetadata
 from utils.logger import get_logger
+from utils.serialization import dumps_json
 
 
 _LOGGER = get_logger(__name__)
 _COLLECTION_NAME = "schemas"
+_HISTORY_BATCH_SIZE = 100
+_CONTENT_HASH_FIELD = "_content_hash"
+# Regeneration timestamps alone should not count as a schema change.
+_HASH_EXCLUDED_FIELDS = {"_id", _CONTENT_HASH_FIELD, "generated_at"}
+
+
+# Database names whose lookup index is known to exist, per client object
+# (held weakly, so a new client never inherits a closed one's entries).
+_INDEXED_DATABASES: "WeakKeyDictionary[Any, Set[str]]" = WeakKeyDictionary()
+_INDEX_LOCK = Lock()
 
 
 def _get_collection(db):
-    return db[_COLLECTION_NAME]
+    collection = db[_COLLECTION_NAME]
+    _ensure_indexes(db, collection)
+    return collection
+
+
+def _ensure_indexes(db, collection, force: bool = False) -> None:
+    """Create the (source_id, version) lookup index once per database.
+
+    A database is only remembered after the index was created, so a failed
+    attempt is retried on the next access. ``force`` re-creates it anyway,
+    for callers that suspect the collection was dropped.
+    """
+
+    client = db.client
+    if not force and db.name in _INDEXED_DATABASES.get(client, ()):
+        return
+    with _INDEX_LOCK:
+        if not force and db.name in _INDEXED_DATABASES.get(client, ()):
+            return
+        try:
+            collection.create_indexes(
+                [
+                    IndexModel(
+                        [("source_id", ASCENDING), ("version", DESCENDING)],
+                        name="source_id_version",
+                        unique=True,
+                    )
+                ]
+            )
+        except PyMongoError as exc:
+            _LOGGER.warning("Failed to create schema lookup index: %s", exc)
+            return
+        _INDEXED_DATABASES.setdefault(client, set()).add(db.name)
 
 
 def _deserialize_schema(document: Optional[dict]) -> Optional[SchemaMetadata]:
     if not document:
         return None
     document.pop("_id", None)
+    document.pop(_CONTENT_HASH_FIELD, None)
     return SchemaMetadata(**document)
 
 
+def _content_hash(payload: Dict[str, Any]) -> str:
+    hashed = {key: value for key, value in payload.items() if key not in _HASH_EXCLUDED_FIELDS}
+    encoded = dumps_json(hashed, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
 def store_schema(db, schema: SchemaMetadata) -> bool:
-    """Persist schema metadata to the schema collection."""
+    """Persist schema metadata to the schema collection.
 
-    collection = _get_collection(db)
+    Returns False without writing when the stored copy already has the same
+    content (``generated_at`` aside). Mongo errors are logged and re-raised.
+    """
+
+    collection = db[_COLLECTION_NAME]
     payload = schema.model_dump()
-    payload.update({"_id": schema.schema_id})
+    content_hash = _content_hash(payload)
+    payload.update({"_id": schema.schema_id, _CONTENT_HASH_FIELD: content_hash})
     try:
+        existing = collection.find_one(
+            {"_id": schema.schema_id}, projection={_CONTENT_HASH_FIELD: 1}
+        )
+        if existing and existing.get(_CONTENT_HASH_FIELD) == content_hash:
+            return False
+        # A schema id the collection has not seen may mean it was dropped,
+        # taking the unique index with it; check again before the insert.
+        _ensure_indexes(db, collection, force=existing is None)
         collection.replace_one({"_id": schema.schema_id}, payload, upsert=True)
         return True
     except PyMongoError as exc:
         _LOGGER.error("Failed to store schema '%s': %s", schema.schema_id, exc)
-        return False
+        raise
 
 
 def retrieve_schema(
@@ -61,17 +127,28 @@ def retrieve_schema(
     return _deserialize_schema(document)
 
 
-def get_schema_history(db, source_id: str) -> List[SchemaMetadata]:
-    """Return all versions for a source."""
+def iter_schema_history(db, source_id: str) -> Iterator[SchemaMetadata]:
+    """Yield all versions for a source without materializing the full history."""
 
     collection = _get_collection(db)
     try:
-        cursor = collection.find({"source_id": source_id}).sort("version", ASCENDING)
+        cursor = (
+            collection.find({"source_id": source_id})
+            .sort("version", ASCENDING)
+            .batch_size(_HISTORY_BATCH_SIZE)
+        )
+        for document in cursor:
+            schema = _deserialize_schema(document)
+            if schema is not None:
+                yield schema
     except PyMongoError as exc:
         _LOGGER.error("Failed to fetch schema history for '%s': %s", source_id, exc)
-        return []
 
-    return [schema for schema in (_deserialize_schema(doc) for doc in cursor) if schema is not None]
+
+def get_schema_history(db, source_id: str) -> List[SchemaMetadata]:
+    """Return all versions for a source."""
+
+    return list(iter_schema_history(db, source_id))
 
 
 def get_latest_schema_version(db, source_id: str) -> int:
@@ -79,7 +156,11 @@ def get_latest_schema_version(db, source_id: str) -> int:
 
     collection = _get_collection(db)
     try:
-        document = collection.find_one({"source_id": source_id}, sort=[("version", DESCENDING)])
+        document = collection.find_one(
+            {"source_id": source_id},
+            projection={"version": 1, "_id": 0},
+            sort=[("version", DESCENDING)],
+        )
     except PyMongoError as exc:
         _LOGGER.error("Failed to fetch latest schema version for '%s': %s", source_id, exc)
         return 0
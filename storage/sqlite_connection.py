@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from threading import Lock
-from typing import Dict, Optional
+from threading import Lock, get_ident, local
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
 
 from config import get_settings
 
 
+_EXECUTEMANY_CHUNK_SIZE = 5000
+# Per-connection prepared statement cache; the stdlib default is 128.
+_CACHED_STATEMENTS = 256
+
+
+def _is_memory_path(target: str) -> bool:
+    return target == ":memory:" or target.startswith("file::memory:") or "mode=memory" in target
+
+
 class SQLiteConnection:
     """Singleton-style SQLite connection helper for ETL pipeline."""
 
@@ -31,38 +41,122 @@ class SQLiteConnection:
             db_path = str(default_path)
 
         self._default_path = db_path
-        self._connections: Dict[str, sqlite3.Connection] = {}
+        # One long-lived connection per (thread, database file), opened on first
+        # use and kept for the process lifetime so switching between
+        # per-version databases never reopens files and concurrent workers
+        # never interleave statements on a shared connection. In-memory
+        # databases are private to their connection, so they stay shared
+        # (thread key 0). The registry lets disconnect() reach every thread.
+        self._connections: Dict[Tuple[int, str], sqlite3.Connection] = {}
+        self._connect_lock = Lock()
+        # Thread-local lookup caches (connections and executemany cursors per
+        # path), dropped whenever the generation moves on after a disconnect.
+        self._local = local()
+        self._generation = 0
+        # Per-table data derived from the table layout (e.g. INSERT plans),
+        # keyed by (db_path, table_name) and dropped whenever DDL touches it.
+        self._table_plans: Dict[Tuple[str, str], Any] = {}
 
     def connect(self, db_path: Optional[str] = None) -> sqlite3.Connection:
         """Establish (or reuse) a SQLite connection for a given db path."""
 
         target = db_path or self._default_path
-        if target in self._connections:
-            return self._connections[target]
+        thread_local = self._thread_local()
+        connection = thread_local.connections.get(target)
+        if connection is not None:
+            return connection
+
+        key = self._registry_key(target)
+        with self._connect_lock:
+            connection = self._connections.get(key)
+            if connection is None:
+                connection = self._open(target)
+                self._connections[key] = connection
+        thread_local.connections[target] = connection
+        return connection
 
-        Path(target).parent.mkdir(parents=True, exist_ok=True)
+    def _thread_local(self) -> local:
+        thread_local = self._local
+        if getattr(thread_local, "generation", None) != self._generation:
+            thread_local.connections = {}
+            thread_local.cursors = {}
+            thread_local.generation = self._generation
+        return thread_local
+
+    @staticmethod
+    def _registry_key(target: str) -> Tuple[int, str]:
+        return (0 if _is_memory_path(target) else get_ident(), target)
+
+    def _open(self, target: str) -> sqlite3.Connection:
+        is_uri = target.startswith("file:")
+        if not is_uri:
+            Path(target).parent.mkdir(parents=True, exist_ok=True)
         connection = sqlite3.connect(
             target,
             check_same_thread=False,
             isolation_level=None,
+            cached_statements=_CACHED_STATEMENTS,
+            uri=is_uri,
         )
-        connection.execute("PRAGMA foreign_keys = ON")
+        for pragma in self._connection_pragmas(target):
+            connection.execute(pragma)
         connection.row_factory = sqlite3.Row
-        self._connections[target] = connection
         return connection
 
+    def _connection_pragmas(self, target: str) -> Tuple[str, ...]:
+        """Return the PRAGMAs applied to every new connection.
+
+        WAL drops the per-commit fsync of the rollback journal and lets readers
+        proceed during writes; the page cache and mmap window keep hot B-tree
+        pages in memory. In-memory databases have no journal file to switch
+        and no file to map.
+        """
+        settings = self._settings
+        pragmas = []
+        if not _is_memory_path(target):
+            pragmas.append(f"PRAGMA journal_mode = {settings.sqlite_journal_mode}")
+            # Memory-mapped reads let the OS page cache serve pages without a
+            # copy into SQLite's own cache. Supported by the default builds on
+            # Linux, macOS and Windows; SQLite silently caps the value at its
+            # compile-time SQLITE_MAX_MMAP_SIZE, and 0 turns it off.
+            pragmas.append(f"PRAGMA mmap_size = {int(settings.sqlite_mmap_bytes)}")
+        pragmas.extend(
+            [
+                f"PRAGMA synchronous = {settings.sqlite_synchronous}",
+                f"PRAGMA temp_store = {settings.sqlite_temp_store}",
+                f"PRAGMA cache_size = -{int(settings.sqlite_cache_size_kib)}",
+                f"PRAGMA busy_timeout = {int(settings.sqlite_busy_timeout_ms)}",
+                f"PRAGMA wal_autocheckpoint = {int(settings.sqlite_wal_autocheckpoint)}",
+                "PRAGMA foreign_keys = ON",
+            ]
+        )
+        return tuple(pragmas)
+
     def disconnect(self, db_path: Optional[str] = None) -> None:
-        """Close one or all SQLite connections."""
+        """Close one or all SQLite connections, across every thread."""
 
         if db_path:
-            connection = self._connections.pop(db_path, None)
-            if connection is not None:
+            self.invalidate_table_plans(db_path)
+            with self._connect_lock:
+                keys = [key for key in self._connections if key[1] == db_path]
+                connections = [self._connections.pop(key) for key in keys]
+                self._generation += 1
+            for connection in connections:
                 connection.close()
             return
 
-        for connection in self._connections.values():
-            connection.close()
-        self._connections.clear()
+        self.disconnect_all()
+
+    def disconnect_all(self, keep_default: bool = False) -> None:
+        """Close every pooled connection, optionally keeping the default database open."""
+
+        for db_path in {key[1] for key in list(self._connections)}:
+            if keep_default and db_path == self._default_path:
+                continue
+            self.disconnect(db_path)
+
+        if not keep_default:
+            self._table_plans.clear()
 
     def get_connection(self, db_path: Optional[str] = None) -> sqlite3.Connection:
         """Return a SQLite connection for the provided path."""
@@ -101,20 +195,92 @@ class SQLiteConnection:
         Returns:
             Cursor object
         """
+        target = db_path or self._default_path
+        conn = self.get_connection(target)
+        # DML-only executemany never leaves rows behind, so one cursor per
+        # (db, statement) can be reused and keeps hitting the statement cache.
+        cursors = self._thread_local().cursors
+        key = (target, query)
+        cursor = cursors.get(key)
+        if cursor is None:
+            cursor = conn.cursor()
+            cursors[key] = cursor
+        return cursor.executemany(query, params_list)
+
+    def executemany_batched(
+        self,
+        query: str,
+        rows: Iterable[Sequence],
+        chunk: int = _EXECUTEMANY_CHUNK_SIZE,
+        db_path: Optional[str] = None,
+    ) -> int:
+        """Execute a query for many rows, committing once per chunk.
+
+        Args:
+            query: SQL query string
+            rows: Iterable of parameter tuples
+            chunk: Number of rows per transaction
+            db_path: Database file path
+
+        Returns:
+            Number of rows written
+        """
         conn = self.get_connection(db_path)
-        return conn.executemany(query, params_list)
+        chunk = max(chunk, 1)
+        total = 0
+        batch: list = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= chunk:
+                total += self._execute_chunk(conn, query, batch)
+                batch = []
+        if batch:
+            total += self._execute_chunk(conn, query, batch)
+        return total
+
+    @staticmethod
+    def _execute_chunk(conn: sqlite3.Connection, query: str, batch: list) -> int:
+        with _raw_transaction(conn):
+            conn.executemany(query, batch)
+        return len(batch)
+
+    def get_table_plan(self, db_path: Optional[str], table_name: str) -> Any:
+        """Return the cached plan for a table, or None if it must be rebuilt."""
+
+        return self._table_plans.get((db_path or self._default_path, table_name))
+
+    def set_table_plan(self, db_path: Optional[str], table_name: str, plan: Any) -> None:
+        """Cache a plan derived from a table's current layout."""
+
+        self._table_plans[(db_path or self._default_path, table_name)] = plan
+
+    def invalidate_table_plans(
+        self, db_path: Optional[str] = None, table_name: Optional[str] = None
+    ) -> None:
+        """Drop cached plans after DDL, for one table, one database, or everything."""
+
+        if db_path is None and table_name is None:
+            self._table_plans.clear()
+            return
+
+        target = db_path or self._default_path
+        self._table_plans = {
+            key: plan
+            for key, plan in self._table_plans.items()
+            if not (key[0] == target and (table_name is None or key[1] == table_name))
+        }
 
     def commit(self, db_path: Optional[str] = None) -> None:
         """Commit current transaction for a connection."""
 
-        connection = self._connections.get(db_path or self._default_path)
+        connection = self._connections.get(self._registry_key(db_path or self._default_path))
         if connection:
             connection.commit()
 
     def rollback(self, db_path: Optional[str] = None) -> None:
         """Rollback current transaction for a connection."""
 
-        connection = self._connections.get(db_path or self._default_path)
+        connection = self._connections.get(self._registry_key(db_path or self._default_path))
         if connection:
             connection.rollback()
 
@@ -126,3 +292,32 @@ class SQLiteConnection:
                 if SQLiteConnection._instance is None:
                     SQLiteConnection._instance = SQLiteConnection()
         return SQLiteConnection._instance
+
+
+@contextmanager
+def transaction(
+    conn: SQLiteConnection, db_path: Optional[str] = None
+) -> Iterator[sqlite3.Connection]:
+    """Run a block of statements in one write transaction (one commit/fsync).
+
+    Connections are opened in autocommit mode, so without this every INSERT
+    commits on its own. Nested use joins the outer transaction.
+    """
+    with _raw_transaction(conn.get_connection(db_path)) as raw:
+        yield raw
+
+
+@contextmanager
+def _raw_transaction(raw: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    if raw.in_transaction:
+        yield raw
+        return
+
+    # The connection's own context manager commits once on exit and rolls back
+    # on error, and unlike a bare ROLLBACK it tolerates SQLite having already
+    # aborted the transaction. Connections stay in autocommit mode
+    # (isolation_level=None) so statements outside this block never leave an
+    # implicit transaction open; the explicit BEGIN takes the write lock up front.
+    raw.execute("BEGIN IMMEDIATE")
+    with raw:
+        yield raw
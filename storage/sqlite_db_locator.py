@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 from config import get_settings
 
@@ -10,8 +13,17 @@ from config import get_settings
 def get_version_db_path(source_id: str, version: int) -> str:
     settings = get_settings()
     base_dir = getattr(settings, "sqlite_base_dir", None)
+    return _resolve_version_db_path(base_dir, settings.sqlite_db_path, source_id, version)
+
+
+@lru_cache(maxsize=512)
+def _resolve_version_db_path(
+    base_dir: Optional[str], sqlite_db_path: str, source_id: str, version: int
+) -> str:
+    # Keyed on the settings values too, so a settings reload resolves afresh;
+    # repeated lookups skip the resolve() and mkdir() syscalls.
     if not base_dir:
-        base_dir = Path(settings.sqlite_db_path).expanduser().resolve().parent
+        base_dir = Path(sqlite_db_path).expanduser().resolve().parent
     root = Path(base_dir).expanduser().resolve()
     safe_source = _sanitize_identifier(source_id)
     version_dir = root / safe_source
@@ -20,7 +32,14 @@ def get_version_db_path(source_id: str, version: int) -> str:
     return str(db_path)
 
 
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]")
+
+
 def _sanitize_identifier(value: str) -> str:
-    allowed = [c if c.isalnum() else "_" for c in value]
-    sanitized = "".join(allowed)
+    if value.isascii():
+        # For ASCII input isalnum() is exactly [A-Za-z0-9], so one C-level
+        # substitution replaces the per-character loop.
+        sanitized = _NON_ALNUM_RE.sub("_", value)
+    else:
+        sanitized = "".join(c if c.isalnum() else "_" for c in value)
     return sanitized.strip("_") or "source"
@@ -1,15 +1,25 @@
 """SQLite document inserter with nested object flattening."""
 
 import json
-from typing import Any, Dict, List, Optional
+import sqlite3
+from itertools import chain
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
-from core.models import SchemaMetadata
-from storage.sqlite_connection import SQLiteConnection
-from storage.sqlite_table_manager import get_table_columns
+from core.models import SchemaField, SchemaMetadata
+from storage.sqlite_connection import SQLiteConnection, transaction
+from storage.sqlite_table_manager import get_not_null_columns, get_table_columns
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_INSERT_TEMPLATE = "INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+
+# Rows folded into one multi-row INSERT; one statement step then writes the
+# whole group instead of one row per step as with executemany.
+ROWS_PER_INSERT_STATEMENT = 64
+# SQLITE_MAX_VARIABLE_NUMBER defaults to 32766 since SQLite 3.32 (999 before).
+_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
 
 def insert_documents_sqlite(
     conn: SQLiteConnection,
@@ -17,7 +27,8 @@ def insert_documents_sqlite(
     table_name: str,
     documents: List[Dict[str, Any]],
     source_id: str,
-    schema: Optional[SchemaMetadata] = None
+    schema: Optional[SchemaMetadata] = None,
+    fields: Optional[List[SchemaField]] = None,
 ) -> int:
     """Insert documents into SQLite table with flattening.
     
@@ -27,6 +38,8 @@ def insert_documents_sqlite(
         documents: List of documents to insert
         source_id: Source identifier
         schema: Optional schema for validation
+        fields: Optional column definitions (used when ``schema`` is not given)
+            to pick a per-column serializer instead of the generic one
         
     Returns:
         Number of documents inserted
@@ -34,45 +47,168 @@ def insert_documents_sqlite(
     if not documents:
         return 0
     
-    # Get table columns
+    plan = _get_insert_plan(conn, db_path, table_name)
+    column_fields = schema.fields if schema is not None else fields
+    columns = _column_layout(plan, column_fields)
+    
+    rows = _prepare_rows(documents, columns, source_id, table_name, plan.required_positions)
+    inserted_count = _insert_batch(conn.get_connection(db_path), table_name, plan, rows)
+    
+    logger.info(f"Inserted {inserted_count}/{len(documents)} documents into {table_name}")
+    return inserted_count
+
+
+class InsertPlan(NamedTuple):
+    """Column layout and INSERT statement for one table."""
+
+    data_columns: Tuple[str, ...]
+    insert_sql: str
+    required_positions: Tuple[int, ...] = ()  # indexes of NOT NULL data columns
+    multi_insert_sql: str = ""  # INSERT with rows_per_statement VALUES groups
+    rows_per_statement: int = 1
+
+
+def _get_insert_plan(conn: SQLiteConnection, db_path: str, table_name: str) -> InsertPlan:
+    """Return the cached INSERT plan for a table, building it on first use."""
+    plan = conn.get_table_plan(db_path, table_name)
+    if plan is not None:
+        return plan
+    
     columns = get_table_columns(conn, db_path, table_name)
     
     # Remove metadata columns from consideration
-    data_columns = [c for c in columns if not c.startswith('_')]
+    data_columns = tuple(c for c in columns if not c.startswith('_'))
     
-    inserted_count = 0
+    col_list = ', '.join(data_columns + ('_source_id',))
+    column_count = len(data_columns) + 1
+    placeholders = ', '.join(['?'] * column_count)
+    # Stay under SQLite's bound-parameter limit however wide the table is.
+    rows_per_statement = max(1, min(ROWS_PER_INSERT_STATEMENT, _MAX_VARIABLES // column_count))
+    not_null = set(get_not_null_columns(conn, db_path, table_name))
+    plan = InsertPlan(
+        data_columns=data_columns,
+        insert_sql=_INSERT_TEMPLATE.format(
+            table=table_name, columns=col_list, placeholders=placeholders
+        ),
+        required_positions=tuple(i for i, c in enumerate(data_columns) if c in not_null),
+        multi_insert_sql=_INSERT_TEMPLATE.format(
+            table=table_name,
+            columns=col_list,
+            placeholders="), (".join([placeholders] * rows_per_statement),
+        ),
+        rows_per_statement=rows_per_statement,
+    )
+    conn.set_table_plan(db_path, table_name, plan)
+    return plan
+
+
+def _column_layout(
+    plan: "InsertPlan", fields: Optional[Sequence[SchemaField]]
+) -> Tuple[Tuple[Callable[[Any], Any], str], ...]:
+    """Pair each data column with the serializer used for its cells."""
+    return tuple(zip(_build_column_serializers(plan.data_columns, fields), plan.data_columns))
+
+
+def _prepare_rows(
+    documents: List[Dict[str, Any]],
+    columns: Tuple[Tuple[Callable[[Any], Any], str], ...],
+    source_id: str,
+    table_name: str,
+    required_positions: Tuple[int, ...] = (),
+) -> List[tuple]:
+    """Build INSERT parameter tuples, dropping rows that would violate NOT NULL.
+    
+    Clean batches take a straight path with no per-document exception
+    handling; only a batch that fails to build is redone row by row.
+    """
+    suffix = (source_id,)
+    try:
+        rows = [
+            tuple(serializer(flattened.get(col)) for serializer, col in columns) + suffix
+            for flattened in map(flatten_document, documents)
+        ]
+    except Exception:
+        rows = _prepare_rows_individually(documents, columns, suffix, table_name)
     
+    if not required_positions:
+        return rows
+    
+    good = [row for row in rows if all(row[i] is not None for i in required_positions)]
+    skipped = len(rows) - len(good)
+    if skipped:
+        logger.warning(
+            f"Skipped {skipped} document(s) for {table_name} with missing NOT NULL values"
+        )
+    return good
+
+
+def _prepare_rows_individually(
+    documents: List[Dict[str, Any]],
+    columns: Tuple[Tuple[Callable[[Any], Any], str], ...],
+    suffix: tuple,
+    table_name: str,
+) -> List[tuple]:
+    rows = []
     for doc in documents:
         try:
-            # Flatten nested document
             flattened = flatten_document(doc)
-            
-            # Prepare values for insertion
-            values = {}
-            for col in data_columns:
-                if col in flattened:
-                    values[col] = serialize_value(flattened[col])
-                else:
-                    values[col] = None
-            
-            # Add metadata
-            values['_source_id'] = source_id
-            
-            # Build INSERT statement
-            col_names = list(values.keys())
-            placeholders = ', '.join(['?' for _ in col_names])
-            col_list = ', '.join(col_names)
-            
-            insert_sql = f"INSERT INTO {table_name} ({col_list}) VALUES ({placeholders})"
-            conn.execute(insert_sql, tuple(values.values()), db_path=db_path)
-            
+            rows.append(tuple(serializer(flattened.get(col)) for serializer, col in columns) + suffix)
+        except Exception as e:
+            logger.warning(f"Failed to prepare document for {table_name}: {e}")
+    return rows
+
+
+def _insert_batch(
+    raw_conn: sqlite3.Connection,
+    table_name: str,
+    plan: InsertPlan,
+    rows: List[tuple],
+) -> int:
+    """Insert prepared rows with multi-row INSERTs, isolating bad rows on failure.
+    
+    Full groups of ``plan.rows_per_statement`` rows go through the multi-row
+    statement and the tail through executemany. Works on the raw
+    ``sqlite3.Connection`` so the hot path skips the wrapper's per-call
+    connection lookup. The bulk attempt runs inside a savepoint so a failing
+    row leaves nothing half-written before the row-by-row fallback skips it.
+    """
+    if not rows:
+        return 0
+    
+    group = plan.rows_per_statement
+    full = len(rows) - len(rows) % group if group > 1 else 0
+    raw_conn.execute("SAVEPOINT insert_rows")
+    try:
+        if full:
+            multi_insert_sql = plan.multi_insert_sql
+            execute = raw_conn.execute
+            for start in range(0, full, group):
+                execute(multi_insert_sql, list(chain.from_iterable(rows[start:start + group])))
+        if full < len(rows):
+            raw_conn.executemany(plan.insert_sql, rows[full:])
+    except Exception as e:
+        raw_conn.execute("ROLLBACK TO insert_rows")
+        raw_conn.execute("RELEASE insert_rows")
+        logger.warning(f"Bulk insert into {table_name} failed ({e}); retrying row by row")
+        return _insert_rows_individually(raw_conn, table_name, plan.insert_sql, rows)
+    raw_conn.execute("RELEASE insert_rows")
+    return len(rows)
+
+
+def _insert_rows_individually(
+    raw_conn: sqlite3.Connection,
+    table_name: str,
+    insert_sql: str,
+    rows: List[tuple],
+) -> int:
+    execute = raw_conn.execute
+    inserted_count = 0
+    for row in rows:
+        try:
+            execute(insert_sql, row)
             inserted_count += 1
-            
         except Exception as e:
             logger.warning(f"Failed to insert document into {table_name}: {e}")
-            continue
-    
-    logger.info(f"Inserted {inserted_count}/{len(documents)} documents into {table_name}")
     return inserted_count
 
 
@@ -87,20 +223,22 @@ def flatten_document(doc: Dict[str, Any], prefix: str = "", sep: str = "_") -> D
     Returns:
         Flattened dict with keys like "parent_child"
     """
-    flattened = {}
+    flattened: Dict[str, Any] = {}
     
-    for key, value in doc.items():
-        new_key = f"{prefix}{sep}{key}" if prefix else key
-        
-        if isinstance(value, dict):
-            # Recursively flatten nested dict
-            nested = flatten_document(value, prefix=new_key, sep=sep)
-            flattened.update(nested)
-        elif isinstance(value, list):
-            # Store arrays as JSON strings
+    # Depth-first walk over an explicit stack of item iterators; keeps the
+    # same key order (and last-wins collisions) as the recursive version.
+    stack = [(prefix, iter(doc.items()))]
+    while stack:
+        current_prefix, items = stack[-1]
+        for key, value in items:
+            new_key = f"{current_prefix}{sep}{key}" if current_prefix else key
+            if isinstance(value, dict):
+                stack.append((new_key, iter(value.items())))
+                break
+            # Lists are kept as-is and stored as JSON strings by serialize_value
             flattened[new_key] = value
         else:
-            flattened[new_key] = value
+            stack.pop()
     
     return flattened
 
@@ -121,7 +259,9 @@ def serialize_value(value: Any) -> Any:
     if isinstance(value, bool):
         return 1 if value else 0
     
-    # Handle lists and dicts (store as JSON)
+    # Handle lists and dicts (store as JSON). Keep json.dumps' default format
+    # (", "/": " separators, \uXXXX escapes) so cells written now compare equal
+    # to the TEXT already stored for the same value.
     if isinstance(value, (list, dict)):
         return json.dumps(value)
     
@@ -129,31 +269,97 @@ def serialize_value(value: Any) -> Any:
     return value
 
 
+_PASSTHROUGH_TYPES = frozenset({str, int, float, type(None)})
+
+
+def _serialize_scalar(value: Any) -> Any:
+    if type(value) in _PASSTHROUGH_TYPES:
+        return value
+    return serialize_value(value)
+
+
+def _serialize_boolean(value: Any) -> Any:
+    if value is True:
+        return 1
+    if value is False:
+        return 0
+    return _serialize_scalar(value)
+
+
+def _serialize_json(value: Any) -> Any:
+    if type(value) in (list, dict):
+        return json.dumps(value)
+    return _serialize_scalar(value)
+
+
+_COLUMN_SERIALIZERS: Dict[str, Callable[[Any], Any]] = {
+    "boolean": _serialize_boolean,
+    "object": _serialize_json,
+    "array": _serialize_json,
+}
+
+
+def _build_column_serializers(
+    data_columns: Sequence[str], fields: Optional[Sequence[SchemaField]]
+) -> List[Callable[[Any], Any]]:
+    """Pick one serializer per column from the declared field types.
+    
+    Each specialized serializer handles its expected type first and falls
+    back to ``serialize_value`` for anything else, so mistyped cells are
+    stored exactly as before.
+    """
+    if not fields:
+        return [serialize_value] * len(data_columns)
+    
+    field_types = {field.name: (field.type or "").lower() for field in fields}
+    return [
+        _COLUMN_SERIALIZERS.get(field_types[col], _serialize_scalar)
+        if col in field_types
+        else serialize_value
+        for col in data_columns
+    ]
+
+
 def batch_insert_documents_sqlite(
     conn: SQLiteConnection,
     db_path: str,
     table_name: str,
     documents: List[Dict[str, Any]],
     source_id: str,
-    batch_size: int = 100
+    batch_size: int = 10_000,
+    fields: Optional[List[SchemaField]] = None,
 ) -> int:
     """Batch insert documents for better performance.
     
+    Each batch runs in its own transaction so its rows share a single commit.
+    
     Args:
         conn: SQLite connection
         table_name: Target table name
         documents: List of documents to insert
         source_id: Source identifier
         batch_size: Number of documents per batch
+        fields: Optional column definitions for per-column serialization
         
     Returns:
         Total number of documents inserted
     """
+    if not documents:
+        return 0
+    
+    # Resolve the connection, INSERT plan and serializers once for all batches.
+    raw_conn = conn.get_connection(db_path)
+    plan = _get_insert_plan(conn, db_path, table_name)
+    columns = _column_layout(plan, fields)
+    
     total_inserted = 0
     
     for i in range(0, len(documents), batch_size):
         batch = documents[i:i + batch_size]
-        count = insert_documents_sqlite(conn, db_path, table_name, batch, source_id)
+        rows = _prepare_rows(batch, columns, source_id, table_name, plan.required_positions)
+        with transaction(conn, db_path):
+            count = _insert_batch(raw_conn, table_name, plan, rows)
+        logger.info(f"Inserted {count}/{len(batch)} documents into {table_name}")
         total_inserted += count
     
     return total_inserted
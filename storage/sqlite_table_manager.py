@@ -1,53 +1,93 @@
 """SQLite table manager for Tier-B structured data storage."""
 
-from typing import List
+import sqlite3
+from typing import List, Optional
 
 from core.models import SchemaField
-from storage.sqlite_connection import SQLiteConnection
+from storage.sqlite_connection import SQLiteConnection, transaction
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_CREATE_TABLE_TEMPLATE = "CREATE TABLE IF NOT EXISTS {table} ({columns}){options}"
+_INDEX_TEMPLATE = "CREATE INDEX IF NOT EXISTS {index} ON {table}({column})"
+_TABLE_EXISTS_SQL = "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
+_TABLE_INFO_TEMPLATE = "PRAGMA table_info({table})"
+
 
 def create_table_from_schema(
     conn: SQLiteConnection,
     db_path: str,
     table_name: str,
     fields: List[SchemaField],
+    with_indexes: bool = False,
+    primary_key: Optional[str] = None,
+    without_rowid: bool = False,
+    strict: bool = False,
 ) -> bool:
-    """Create a SQLite table from schema field definitions."""
+    """Create a SQLite table from schema field definitions.
+
+    Suggested indexes are only built here when ``with_indexes`` is set; bulk
+    loads should call ``create_suggested_indexes`` after inserting so rows do
+    not pay for index maintenance one at a time.
+
+    With ``without_rowid`` and a natural ``primary_key`` field, the table is
+    keyed by that field instead of a surrogate ``_id`` (one B-tree instead of
+    two). ``strict`` requests a STRICT table when every field type is known
+    and the SQLite library supports it.
+    """
     try:
+        field_names = {field.name for field in fields}
+        if without_rowid and primary_key not in field_names:
+            logger.warning(
+                f"WITHOUT ROWID requested for '{table_name}' without a known primary key; "
+                "using a rowid table"
+            )
+            without_rowid = False
+        if strict and not _supports_strict(fields):
+            logger.warning(f"STRICT not applicable to '{table_name}'; using a regular table")
+            strict = False
+        map_type = _map_type_to_sqlite_strict if strict else _map_type_to_sqlite
+
         # Build CREATE TABLE statement
         columns = []
         
-        # Add an auto-increment ID column
-        columns.append("_id INTEGER PRIMARY KEY AUTOINCREMENT")
+        if not without_rowid:
+            # Add an auto-increment ID column
+            columns.append("_id INTEGER PRIMARY KEY AUTOINCREMENT")
         
         # Add schema fields
         for field in fields:
             col_name = field.name
-            col_type = _map_type_to_sqlite(field.type)
+            col_type = map_type(field.type)
+            if without_rowid and col_name == primary_key:
+                columns.append(f"{col_name} {col_type} NOT NULL PRIMARY KEY")
+                continue
             nullable = "NULL" if field.nullable else "NOT NULL"
             
             columns.append(f"{col_name} {col_type} {nullable}")
         
         # Add metadata columns
         columns.append("_source_id TEXT")
-        columns.append("_ingested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP")
+        columns.append(f"_ingested_at {map_type('datetime')} DEFAULT CURRENT_TIMESTAMP")
         
-        create_sql = f"""
-        CREATE TABLE IF NOT EXISTS {table_name} (
-            {', '.join(columns)}
+        options = []
+        if strict:
+            options.append("STRICT")
+        if without_rowid:
+            options.append("WITHOUT ROWID")
+        create_sql = _CREATE_TABLE_TEMPLATE.format(
+            table=table_name,
+            columns=", ".join(columns),
+            options=" " + ", ".join(options) if options else "",
         )
-        """
 
         conn.execute(create_sql, db_path=db_path)
+        conn.invalidate_table_plans(db_path, table_name)
         logger.info(f"Created table '{table_name}' with {len(fields)} columns in {db_path}")
 
-        # Create indexes for suggested fields
-        for field in fields:
-            if field.suggested_index:
-                create_index(conn, db_path, table_name, field.name)
+        if with_indexes:
+            create_suggested_indexes(conn, db_path, table_name, fields)
 
         return True
     except Exception as e:
@@ -55,6 +95,31 @@ def create_table_from_schema(
         return False
 
 
+def create_suggested_indexes(
+    conn: SQLiteConnection,
+    db_path: str,
+    table_name: str,
+    fields: List[SchemaField],
+) -> int:
+    """Create indexes for every ``suggested_index`` field in one transaction.
+
+    Meant to run once after the initial bulk load.
+
+    Returns:
+        Number of indexes created
+    """
+    columns = [field.name for field in fields if field.suggested_index]
+    if not columns:
+        return 0
+
+    created = 0
+    with transaction(conn, db_path):
+        for column_name in columns:
+            if create_index(conn, db_path, table_name, column_name):
+                created += 1
+    return created
+
+
 def create_index(conn: SQLiteConnection, db_path: str, table_name: str, column_name: str) -> bool:
     """Create an index on a table column.
     
@@ -68,7 +133,7 @@ def create_index(conn: SQLiteConnection, db_path: str, table_name: str, column_n
     """
     try:
         index_name = f"idx_{table_name}_{column_name}"
-        index_sql = f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name}({column_name})"
+        index_sql = _INDEX_TEMPLATE.format(index=index_name, table=table_name, column=column_name)
         conn.execute(index_sql, db_path=db_path)
         logger.info(f"Created index '{index_name}'")
         return True
@@ -77,6 +142,36 @@ def create_index(conn: SQLiteConnection, db_path: str, table_name: str, column_n
         return False
 
 
+_SQLITE_TYPE_MAPPING = {
+    "string": "TEXT",
+    "integer": "INTEGER",
+    "number": "REAL",
+    "float": "REAL",
+    "boolean": "INTEGER",  # SQLite uses 0/1 for boolean
+    "datetime": "TIMESTAMP",
+    "date": "DATE",
+    "object": "TEXT",  # Store as JSON
+    "array": "TEXT",   # Store as JSON
+    "null": "TEXT"
+}
+
+
+# STRICT tables only accept INT, INTEGER, REAL, TEXT, BLOB and ANY
+_STRICT_TYPE_OVERRIDES = {"TIMESTAMP": "TEXT", "DATE": "TEXT"}
+_STRICT_MIN_SQLITE_VERSION = (3, 37, 0)
+
+
+def _supports_strict(fields: List[SchemaField]) -> bool:
+    if sqlite3.sqlite_version_info < _STRICT_MIN_SQLITE_VERSION:
+        return False
+    return all((field.type or "").lower() in _SQLITE_TYPE_MAPPING for field in fields)
+
+
+def _map_type_to_sqlite_strict(field_type: str) -> str:
+    sqlite_type = _map_type_to_sqlite(field_type)
+    return _STRICT_TYPE_OVERRIDES.get(sqlite_type, sqlite_type)
+
+
 def _map_type_to_sqlite(field_type: str) -> str:
     """Map schema field type to SQLite type.
     
@@ -86,20 +181,7 @@ def _map_type_to_sqlite(field_type: str) -> str:
     Returns:
         SQLite type string
     """
-    type_mapping = {
-        "string": "TEXT",
-        "integer": "INTEGER",
-        "number": "REAL",
-        "float": "REAL",
-        "boolean": "INTEGER",  # SQLite uses 0/1 for boolean
-        "datetime": "TIMESTAMP",
-        "date": "DATE",
-        "object": "TEXT",  # Store as JSON
-        "array": "TEXT",   # Store as JSON
-        "null": "TEXT"
-    }
-    
-    return type_mapping.get(field_type.lower(), "TEXT")
+    return _SQLITE_TYPE_MAPPING.get(field_type.lower(), "TEXT")
 
 
 def table_exists(conn: SQLiteConnection, db_path: str, table_name: str) -> bool:
@@ -112,11 +194,7 @@ def table_exists(conn: SQLiteConnection, db_path: str, table_name: str) -> bool:
     Returns:
         True if table exists
     """
-    cursor = conn.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-        (table_name,),
-        db_path=db_path,
-    )
+    cursor = conn.execute(_TABLE_EXISTS_SQL, (table_name,), db_path=db_path)
     return cursor.fetchone() is not None
 
 
@@ -130,6 +208,20 @@ def get_table_columns(conn: SQLiteConnection, db_path: str, table_name: str) ->
     Returns:
         List of column names
     """
-    cursor = conn.execute(f"PRAGMA table_info({table_name})", db_path=db_path)
+    cursor = conn.execute(_TABLE_INFO_TEMPLATE.format(table=table_name), db_path=db_path)
     rows = cursor.fetchall()
     return [row[1] for row in rows]  # Column name is at index 1
+
+
+def get_not_null_columns(conn: SQLiteConnection, db_path: str, table_name: str) -> List[str]:
+    """Get the names of columns declared NOT NULL.
+    
+    Args:
+        conn: SQLite connection
+        table_name: Table name
+        
+    Returns:
+        List of column names
+    """
+    cursor = conn.execute(_TABLE_INFO_TEMPLATE.format(table=table_name), db_path=db_path)
+    return [row[1] for row in cursor.fetchall() if row[3]]  # notnull flag is at index 3
@@ -7,6 +7,15 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_SQLITE_SOURCE_TYPES = ("html_table", "csv_block", "kv")
+
+# Unstructured/nested -> MongoDB; structured/tabular -> SQLite
+_ROUTES_BY_SOURCE_TYPE: Dict[str, str] = {
+    "json": "mongodb",
+    "yaml_block": "mongodb",
+    **{source_type: "sqlite" for source_type in _SQLITE_SOURCE_TYPES},
+}
+
 
 def categorize_records_by_storage(
     records: List[NormalizedRecord]
@@ -23,35 +32,21 @@ def categorize_records_by_storage(
     Returns:
         Dict with keys 'mongodb' and 'sqlite', each containing list of records
     """
-    mongodb_records = []
-    sqlite_records = []
+    buckets: Dict[str, List[NormalizedRecord]] = {"mongodb": [], "sqlite": []}
 
     for record in records:
-        source_type = record.source_type
-
-        # Route based on source type
-        if source_type in ["json", "yaml_block"]:
-            # Unstructured/nested -> MongoDB
-            mongodb_records.append(record)
-        elif source_type in ["html_table", "csv_block", "kv"]:
-            # Structured/tabular -> SQLite
-            sqlite_records.append(record)
-        else:
+        route = _ROUTES_BY_SOURCE_TYPE.get(record.source_type)
+        if route is None:
             # Default: check data shape
-            if _is_flat_structure(record.data):
-                sqlite_records.append(record)
-            else:
-                mongodb_records.append(record)
+            route = "sqlite" if _is_flat_structure(record.data) else "mongodb"
+        buckets[route].append(record)
 
     logger.info(
         f"Categorized {len(records)} records: "
-        f"{len(mongodb_records)} MongoDB, {len(sqlite_records)} SQLite"
+        f"{len(buckets['mongodb'])} MongoDB, {len(buckets['sqlite'])} SQLite"
     )
 
-    return {
-        "mongodb": mongodb_records,
-        "sqlite": sqlite_records
-    }
+    return buckets
 
 
 def _is_flat_structure(data: Dict[str, Any]) -> bool:
@@ -81,8 +76,7 @@ def should_use_sqlite(source_type: str) -> bool:
     Returns:
         True if SQLite should be used
     """
-    sqlite_types = ["html_table", "csv_block", "kv"]
-    return source_type in sqlite_types
+    return source_type in _SQLITE_SOURCE_TYPES
 
 
 def get_compatible_dbs_for_schema(
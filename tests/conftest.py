@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import os
-from typing import Generator
+from typing import TYPE_CHECKING, Callable, Dict, Generator, Tuple
 
-import mongomock
 import pytest
 
+if TYPE_CHECKING:
+    import mongomock
+
 os.environ.setdefault("ETL_MONGODB_URI", "mongodb://localhost:27017")
+# Per-version SQLite files written by the tests are throwaway, so skip the
+# WAL bookkeeping and fsyncs the production defaults pay for durability
+os.environ.setdefault("ETL_SQLITE_JOURNAL_MODE", "MEMORY")
+os.environ.setdefault("ETL_SQLITE_SYNCHRONOUS", "OFF")
 
 from services import pipeline_service
 from storage.connection import MongoConnection
 from storage.sqlite_connection import SQLiteConnection
+from tests.payloads import TEST_PAYLOADS
 
 
 class _FakeMongoConnection:
@@ -34,11 +41,33 @@ class _FakeMongoConnection:
         return None
 
 
-@pytest.fixture(autouse=True)
-def mock_mongo_connection(monkeypatch) -> Generator[mongomock.MongoClient, None, None]:
-    """Provide an in-memory MongoDB for every test."""
+def pytest_collection_modifyitems(config, items):
+    """Attach the in-memory MongoDB only to tests marked ``mongo``."""
+
+    for item in items:
+        if item.get_closest_marker("mongo") and "mock_mongo_connection" not in item.fixturenames:
+            item.fixturenames.insert(0, "mock_mongo_connection")
+
+
+@pytest.fixture(scope="session")
+def session_mongo_client() -> mongomock.MongoClient:
+    """One in-memory MongoDB client shared by the whole test session."""
+
+    import mongomock
+
+    return mongomock.MongoClient()
 
-    client = mongomock.MongoClient()
+
+@pytest.fixture
+def mock_mongo_connection(
+    monkeypatch, session_mongo_client
+) -> Generator[mongomock.MongoClient, None, None]:
+    """Provide an in-memory MongoDB for tests marked ``mongo`` (or requesting it).
+
+    The session client is reused; every database is dropped after the test.
+    """
+
+    client = session_mongo_client
     fake_connection = _FakeMongoConnection(client)
 
     monkeypatch.setattr(
@@ -49,6 +78,9 @@ def mock_mongo_connection(monkeypatch) -> Generator[mongomock.MongoClient, None,
 
     yield client
 
+    for name in client.list_database_names():
+        client.drop_database(name)
+
 
 @pytest.fixture(autouse=True)
 def stub_collection_creation(monkeypatch):
@@ -65,12 +97,45 @@ def stub_collection_creation(monkeypatch):
     )
 
 
+@pytest.fixture(scope="session")
+def materialized_payload(tmp_path_factory) -> Callable[..., str]:
+    """Return a factory that writes a ``TEST_PAYLOADS`` entry to disk once per session.
+
+    ``process_upload`` only reads the file, so tests that upload the same
+    payload can share one path.
+    """
+
+    directory = tmp_path_factory.mktemp("payloads")
+    paths: Dict[Tuple[str, str], str] = {}
+
+    def _materialize(key: str, suffix: str = ".txt") -> str:
+        path = paths.get((key, suffix))
+        if path is None:
+            file_path = directory / f"{key}{suffix}"
+            file_path.write_text(TEST_PAYLOADS[key])
+            path = paths[(key, suffix)] = str(file_path)
+        return path
+
+    return _materialize
+
+
+_USER_TABLES_SQL = "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+
+
+@pytest.fixture(scope="session")
+def session_sqlite_connection() -> Generator[SQLiteConnection, None, None]:
+    """One in-memory SQLite database shared by the whole test session."""
+
+    connection = SQLiteConnection(db_path=":memory:")
+    yield connection
+    connection.disconnect()
+
+
 @pytest.fixture(autouse=True)
-def isolated_sqlite_connection(monkeypatch, tmp_path):
-    """Provide a fresh SQLite database per test and override the singleton."""
+def isolated_sqlite_connection(monkeypatch, session_sqlite_connection):
+    """Override the singleton with the session database, emptied after each test."""
 
-    db_path = tmp_path / "etl_pipeline.sqlite"
-    connection = SQLiteConnection(db_path=str(db_path))
+    connection = session_sqlite_connection
 
     monkeypatch.setattr(
         SQLiteConnection,
@@ -80,4 +145,16 @@ def isolated_sqlite_connection(monkeypatch, tmp_path):
 
     yield connection
 
-    connection.disconnect()
\ No newline at end of file
+    _reset_sqlite_connection(connection)
+
+
+def _reset_sqlite_connection(connection: SQLiteConnection) -> None:
+    """Drop every user table from the default database and close per-version files."""
+
+    raw = connection.get_connection()
+    if raw.in_transaction:
+        raw.rollback()
+    for (table_name,) in raw.execute(_USER_TABLES_SQL).fetchall():
+        raw.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+    connection.invalidate_table_plans()
+    connection.disconnect_all(keep_default=True)
@@ -5,7 +5,11 @@ All payloads are raw text strings that can be directly used for testing.
 No fictional APIs, no magical fields, no hidden assumptions.
 """
 
-TEST_PAYLOADS = {
+from types import MappingProxyType
+
+# Built once per process and exposed read-only. The literals are compiled
+# into this module's .pyc, so later imports already load them with marshal.
+_PAYLOADS = {
     "test_case_1_simple_valid_json": """{
   "user_id": 1001,
   "username": "alice_wonder",
@@ -746,6 +750,8 @@ tier: B-10
 """
 }
 
+TEST_PAYLOADS = MappingProxyType(_PAYLOADS)
+
 if __name__ == "__main__":
     # Verify all payloads
     print(f"Total test payloads: {len(TEST_PAYLOADS)}")
@@ -0,0 +1,92 @@
+"""Unit tests for MongoDB document insertion helpers."""
+
+from datetime import datetime
+
+import mongomock
+
+from core import SchemaField, SchemaMetadata
+from storage.document_inserter import (
+    ValidationMode,
+    batch_insert_documents,
+    build_validator,
+    insert_documents,
+)
+
+
+def _schema(*fields: SchemaField) -> SchemaMetadata:
+    return SchemaMetadata(
+        schema_id="demo_v1",
+        source_id="demo",
+        version=1,
+        fields=list(fields),
+        generated_at=datetime.utcnow(),
+        record_count=0,
+        extraction_stats={},
+    )
+
+
+def test_build_validator_checks_types_and_unknown_fields():
+    validator = build_validator(
+        _schema(
+            SchemaField(name="id", type="integer"),
+            SchemaField(name="price", type="number"),
+            SchemaField(name="active", type="boolean"),
+            SchemaField(name="name", type="string"),
+        )
+    )
+
+    assert validator({"_id": "x", "id": 1, "price": 2, "active": True, "name": None})
+    assert not validator({"id": True})
+    assert not validator({"price": "1.0"})
+    assert not validator({"unexpected": 1})
+    assert not validator(["not", "a", "dict"])
+
+
+def test_insert_documents_counts_partial_bulk_failures(mock_mongo_connection):
+    db = mock_mongo_connection["demo"]
+
+    inserted = insert_documents(db, "records", [{"_id": 1}, {"_id": 1}, {"_id": 2}])
+
+    assert inserted == 2
+    assert db["records"].count_documents({}) == 2
+
+
+def test_client_only_validation_filters_before_insert(mock_mongo_connection):
+    db = mock_mongo_connection["demo"]
+    schema = _schema(SchemaField(name="id", type="integer"))
+
+    inserted = batch_insert_documents(
+        db,
+        "records",
+        [{"id": 1}, {"id": "bad"}, {"id": 3}],
+        schema=schema,
+        validation_mode=ValidationMode.CLIENT_ONLY,
+    )
+
+    assert inserted == 2
+    assert sorted(doc["id"] for doc in db["records"].find()) == [1, 3]
+
+
+def test_pre_validated_takes_precedence_over_schema(mock_mongo_connection, monkeypatch):
+    db = mock_mongo_connection["demo"]
+    schema = _schema(SchemaField(name="id", type="integer"))
+    bypass_flags = []
+    original = mongomock.collection.Collection.insert_many
+
+    def _spy(self, documents, *args, bypass_document_validation=False, **kwargs):
+        bypass_flags.append(bypass_document_validation)
+        return original(self, documents, *args, **kwargs)
+
+    monkeypatch.setattr(mongomock.collection.Collection, "insert_many", _spy)
+
+    # Small batches would otherwise default to SERVER_ONLY and re-enable the validator
+    inserted = batch_insert_documents(
+        db,
+        "records",
+        [{"id": 1}, {"id": "trusted"}],
+        pre_validated=True,
+        schema=schema,
+    )
+
+    assert inserted == 2
+    assert bypass_flags == [True]
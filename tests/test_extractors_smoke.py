@@ -9,10 +9,13 @@ from tests.payloads import TEST_PAYLOADS
 
 EXTRACTION_TEXT = TEST_PAYLOADS["test_case_7_mixed_json_and_kv_same_file"]
 
+# Extractors hold no per-call state, so one instance serves every test
+_JSON_EXTRACTOR = JSONExtractor()
+_KV_EXTRACTOR = KVExtractor()
+
 
 def test_json_extractor_finds_multiple_fragments():
-    extractor = JSONExtractor()
-    records = extractor.extract(EXTRACTION_TEXT)
+    records = _JSON_EXTRACTOR.extract(EXTRACTION_TEXT)
 
     assert len(records) >= 2
     transaction_record = next((rec for rec in records if rec.data.get("transaction_id")), None)
@@ -25,8 +28,7 @@ def test_json_extractor_finds_multiple_fragments():
 
 
 def test_kv_extractor_captures_payment_metadata():
-    extractor = KVExtractor()
-    records = extractor.extract(EXTRACTION_TEXT)
+    records = _KV_EXTRACTOR.extract(EXTRACTION_TEXT)
 
     assert len(records) >= 2
     payment_record = next((rec for rec in records if rec.data.get("payment_method")), None)
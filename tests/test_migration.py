@@ -0,0 +1,46 @@
+"""Unit tests for MongoDB schema evolution."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from core import SchemaField, SchemaMetadata
+from storage.migration import evolve_collection_schema
+
+pytestmark = pytest.mark.mongo
+
+
+def _schema(*field_names: str) -> SchemaMetadata:
+    return SchemaMetadata(
+        schema_id="src_v1",
+        source_id="src",
+        version=1,
+        fields=[SchemaField(name=name, type="string") for name in field_names],
+        generated_at=datetime.now(timezone.utc),
+        record_count=1,
+        extraction_stats={},
+    )
+
+
+def test_added_fields_leave_existing_documents_untouched_by_default(mock_mongo_connection):
+    db = mock_mongo_connection["etl_test"]
+    db["records"].insert_many([{"name": "a"}, {"name": "b", "email": "b@x.io"}])
+
+    assert evolve_collection_schema(db, "records", _schema("name"), _schema("name", "email"))
+
+    stored = list(db["records"].find({}, {"_id": 0}).sort("name", 1))
+    assert stored == [{"name": "a"}, {"name": "b", "email": "b@x.io"}]
+    # A missing field still matches a null lookup without any backfill
+    assert db["records"].count_documents({"email": None}) == 1
+
+
+def test_added_fields_are_backfilled_when_requested(mock_mongo_connection):
+    db = mock_mongo_connection["etl_test"]
+    db["records"].insert_many([{"name": "a"}, {"name": "b", "email": "b@x.io"}])
+
+    assert evolve_collection_schema(
+        db, "records", _schema("name"), _schema("name", "email"), backfill=True
+    )
+
+    stored = list(db["records"].find({}, {"_id": 0}).sort("name", 1))
+    assert stored == [{"name": "a", "email": None}, {"name": "b", "email": "b@x.io"}]
@@ -0,0 +1,70 @@
+"""Unit tests for MongoClient option handling."""
+
+from config import get_settings
+from storage.connection import MongoConnection
+
+
+def test_unset_settings_keep_driver_defaults():
+    client = MongoConnection("mongodb://localhost:27017")._create_client()
+    try:
+        assert client.write_concern.document == {}
+        assert client.options.pool_options.max_pool_size == 100
+        assert client.options.server_selection_timeout == 30
+    finally:
+        client.close()
+
+
+def test_configured_settings_are_passed_to_the_client():
+    connection = MongoConnection("mongodb://localhost:27017")
+    connection._settings = get_settings().model_copy(
+        update={
+            "mongodb_pool_size": 7,
+            "mongodb_server_selection_timeout_ms": 1500,
+            "mongodb_write_concern": "majority",
+        }
+    )
+    client = connection._create_client()
+    try:
+        assert client.write_concern.document == {"w": "majority"}
+        assert client.options.pool_options.max_pool_size == 7
+        assert client.options.server_selection_timeout == 1.5
+    finally:
+        client.close()
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_disconnect_closes_a_shared_client_only_after_the_last_holder(monkeypatch):
+    uri = "mongodb://shared-client-test:27017"
+    created = []
+
+    def _create_client(self):
+        created.append(_FakeClient())
+        return created[-1]
+
+    monkeypatch.setattr(MongoConnection, "_create_client", _create_client)
+    first = MongoConnection(uri)
+    second = MongoConnection(uri)
+
+    client = first.connect()
+    assert second.connect() is client
+
+    first.disconnect()
+    assert not client.closed
+    assert second.get_client() is client
+
+    second.disconnect()
+    assert client.closed
+    assert uri not in MongoConnection._clients
+
+    # A later connect opens a fresh client instead of reusing the closed one
+    reopened = first.connect()
+    assert reopened is not client and not reopened.closed
+    first.disconnect()
+    assert len(created) == 2
@@ -0,0 +1,104 @@
+"""Unit tests for schema persistence."""
+
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import mongomock
+import pytest
+from pymongo.errors import OperationFailure
+
+from core import SchemaField, SchemaMetadata
+from storage.schema_store import iter_schema_history, retrieve_schema, store_schema
+
+pytestmark = pytest.mark.mongo
+
+
+def _schema(*field_names: str, generated_at: datetime, version: int = 1) -> SchemaMetadata:
+    return SchemaMetadata(
+        schema_id=f"src_v{version}",
+        source_id="src",
+        version=version,
+        fields=[SchemaField(name=name, type="string") for name in field_names],
+        generated_at=generated_at,
+        record_count=2,
+        extraction_stats={"records": 2},
+    )
+
+
+@pytest.fixture
+def replace_calls(monkeypatch) -> List[str]:
+    calls: List[str] = []
+    original = mongomock.collection.Collection.replace_one
+
+    def _spy(self, filter, replacement, *args, **kwargs):
+        calls.append(filter["_id"])
+        return original(self, filter, replacement, *args, **kwargs)
+
+    monkeypatch.setattr(mongomock.collection.Collection, "replace_one", _spy)
+    return calls
+
+
+def test_store_schema_skips_unchanged_content(mock_mongo_connection, replace_calls):
+    db = mock_mongo_connection["etl_test"]
+    generated_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    assert store_schema(db, _schema("name", generated_at=generated_at)) is True
+    assert store_schema(db, _schema("name", generated_at=generated_at)) is False
+    assert replace_calls == ["src_v1"]
+
+
+def test_store_schema_ignores_generated_at_changes(mock_mongo_connection, replace_calls):
+    db = mock_mongo_connection["etl_test"]
+    first = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    assert store_schema(db, _schema("name", generated_at=first)) is True
+    assert store_schema(db, _schema("name", generated_at=first + timedelta(hours=1))) is False
+    assert replace_calls == ["src_v1"]
+    assert retrieve_schema(db, "src").generated_at.replace(tzinfo=timezone.utc) == first
+
+
+def test_store_schema_writes_field_changes(mock_mongo_connection, replace_calls):
+    db = mock_mongo_connection["etl_test"]
+    generated_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    assert store_schema(db, _schema("name", generated_at=generated_at)) is True
+    assert store_schema(db, _schema("name", "email", generated_at=generated_at)) is True
+    assert replace_calls == ["src_v1", "src_v1"]
+    assert [field.name for field in retrieve_schema(db, "src").fields] == ["name", "email"]
+
+
+def _has_lookup_index(db) -> bool:
+    return "source_id_version" in db["schemas"].index_information()
+
+
+def test_lookup_index_is_retried_after_a_failed_create(mock_mongo_connection, monkeypatch):
+    db = mock_mongo_connection["etl_index_retry"]
+    original = mongomock.collection.Collection.create_indexes
+    failures = [OperationFailure("transient")]
+
+    def _flaky_create_indexes(self, *args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(mongomock.collection.Collection, "create_indexes", _flaky_create_indexes)
+
+    assert retrieve_schema(db, "src") is None
+    assert not _has_lookup_index(db)
+
+    assert list(iter_schema_history(db, "src")) == []
+    assert _has_lookup_index(db)
+
+
+def test_lookup_index_is_recreated_after_the_database_is_dropped(mock_mongo_connection):
+    client = mock_mongo_connection
+    generated_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    assert store_schema(client["etl_test"], _schema("name", generated_at=generated_at))
+    assert _has_lookup_index(client["etl_test"])
+
+    client.drop_database("etl_test")
+
+    db = client["etl_test"]
+    assert store_schema(db, _schema("name", "email", generated_at=generated_at, version=2))
+    assert _has_lookup_index(db)
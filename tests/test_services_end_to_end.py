@@ -8,10 +8,16 @@ import pytest
 
 from typing import Iterable, Set
 
-from services.pipeline_service import process_upload
+from core.exceptions import ExtractionError, QueryExecutionError
+from services.pipeline_service import process_upload, process_upload_bytes
 from services import query_service, schema_service
 from tests.payloads import TEST_PAYLOADS
 
+pytestmark = pytest.mark.mongo
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 def _get_table_with_fields(schema, required_fields: Iterable[str]) -> str:
     required: Set[str] = set(required_fields)
@@ -25,16 +31,13 @@ def _get_table_with_fields(schema, required_fields: Iterable[str]) -> str:
 
 
 @pytest.mark.integration
-def test_process_upload_and_query_roundtrip(tmp_path):
+def test_process_upload_and_query_roundtrip(materialized_payload):
     """Upload a sample file and ensure queries return expected records."""
 
     source_id = "demo-source"
-    file_content = TEST_PAYLOADS["test_case_7_mixed_json_and_kv_same_file"]
+    file_path = materialized_payload("test_case_7_mixed_json_and_kv_same_file")
 
-    sample_file = tmp_path / "sample_input.txt"
-    sample_file.write_text(file_content)
-
-    response = process_upload(str(sample_file), source_id)
+    response = process_upload(file_path, source_id)
 
     assert response.status == "success"
     assert response.records_extracted >= 4
@@ -79,16 +82,13 @@ def test_process_upload_and_query_roundtrip(tmp_path):
 
 
 @pytest.mark.integration
-def test_markdown_upload_with_code_blocks_and_html(tmp_path):
+def test_markdown_upload_with_code_blocks_and_html(materialized_payload):
     """Ensure markdown files with JSON and HTML code blocks are processed."""
 
     source_id = "demo-markdown"
-    file_content = TEST_PAYLOADS["test_case_21_embedded_code_block_fences"]
+    file_path = materialized_payload("test_case_21_embedded_code_block_fences", suffix=".md")
 
-    sample_file = tmp_path / "sample_input.md"
-    sample_file.write_text(file_content)
-
-    response = process_upload(str(sample_file), source_id)
+    response = process_upload(file_path, source_id)
 
     assert response.status == "success"
     assert response.records_extracted >= 1
@@ -119,16 +119,39 @@ def test_markdown_upload_with_code_blocks_and_html(tmp_path):
 
 
 @pytest.mark.integration
-def test_multiple_fragments_with_complex_queries(tmp_path):
+def test_process_upload_bytes_accepts_bytes_and_str():
+    """In-memory uploads parse bytes and decoded text alike and reject non-bytes PDFs."""
+
+    content = TEST_PAYLOADS["test_case_21_embedded_code_block_fences"]
+
+    from_bytes = process_upload_bytes(
+        content.encode("utf-8"), "demo-markdown-bytes", filename_hint="payload.md"
+    )
+    from_str = process_upload_bytes(content, "demo-markdown-str", filename_hint="payload.md")
+
+    for response in (from_bytes, from_str):
+        assert response.status == "success"
+        assert response.parsed_fragments_summary["json_fragments"] >= 1
+    assert from_bytes.records_extracted == from_str.records_extracted
+    assert from_bytes.parsed_fragments_summary == from_str.parsed_fragments_summary
+
+    json_block_query = query_service.execute_query(
+        "demo-markdown-bytes", {"filter": {"user_id": 8888}}
+    )
+    assert json_block_query.result_count == 1
+
+    with pytest.raises(ExtractionError):
+        process_upload_bytes("%PDF-1.4", "demo-pdf-str", filename_hint="payload.pdf")
+
+
+@pytest.mark.integration
+def test_multiple_fragments_with_complex_queries(materialized_payload):
     """Handle multiple Tier A fragments and run advanced queries."""
 
     source_id = "demo-complex"
-    file_content = TEST_PAYLOADS["test_case_1_simple_valid_json"]
+    file_path = materialized_payload("test_case_1_simple_valid_json")
 
-    sample_file = tmp_path / "sample_complex.txt"
-    sample_file.write_text(file_content)
-
-    response = process_upload(str(sample_file), source_id)
+    response = process_upload(file_path, source_id)
 
     assert response.status == "success"
     assert response.records_extracted >= 2
@@ -158,13 +181,62 @@ def test_multiple_fragments_with_complex_queries(tmp_path):
     assert sorted_query.results[0]["user_id"] == 1002
 
 
+@pytest.mark.integration
+def test_execute_batch_preserves_order_across_engines(materialized_payload, monkeypatch):
+    """Batched queries return results in request order and read the schema once."""
+
+    source_id = "demo-batch"
+    file_path = materialized_payload("test_case_21_embedded_code_block_fences", suffix=".md")
+    assert process_upload(file_path, source_id).status == "success"
+
+    schema = schema_service.get_current_schema(source_id)
+    kv_table = _get_table_with_fields(schema, ["actual_field", "real_data"])
+    sqlite_query = {
+        "engine": "sqlite",
+        "table": kv_table,
+        "select": ["actual_field", "real_data"],
+        "where": {"actual_field": "actual_value"},
+    }
+
+    schema_reads = []
+    get_current_schema = schema_service.get_current_schema
+
+    def _counting_get_current_schema(requested_source_id):
+        schema_reads.append(requested_source_id)
+        return get_current_schema(requested_source_id)
+
+    monkeypatch.setattr(schema_service, "get_current_schema", _counting_get_current_schema)
+
+    results = query_service.execute_batch(
+        source_id,
+        [
+            {"filter": {"user_id": 8888}},
+            sqlite_query,
+            {"engine": "MongoDB", "filter": {"user_id": -1}},
+            dict(sqlite_query, select=["real_data"]),
+        ],
+    )
+
+    assert [result.query["engine"] for result in results] == ["mongodb", "sqlite", "mongodb", "sqlite"]
+    assert results[0].results[0]["username"] == "code_block_user"
+    assert results[1].results == [{"actual_field": "actual_value", "real_data": "this is real"}]
+    assert results[2].result_count == 0
+    assert results[3].results == [{"real_data": "this is real"}]
+    assert schema_reads == [source_id]
+
+    assert query_service.execute_batch(source_id, []) == []
+    with pytest.raises(QueryExecutionError):
+        query_service.execute_batch(source_id, [{"filter": {}}, "not a query"])
+    with pytest.raises(QueryExecutionError):
+        query_service.execute_batch(source_id, [{"engine": "postgres"}])
+
+
 @pytest.mark.integration
 def test_sqlite_engine_query_execution(tmp_path):
     """Ensure SQLite-routed sources can be queried via the new engine flag."""
 
     source_id = "demo-sqlite"
-    repo_root = Path(__file__).resolve().parents[1]
-    template_path = repo_root / "test_data" / "sample_tier_b_sqlite.txt"
+    template_path = REPO_ROOT / "test_data" / "sample_tier_b_sqlite.txt"
 
     if not template_path.is_file():
         pytest.skip("SQLite sample file not found; skipping test.")
@@ -236,8 +308,7 @@ def test_mixed_tier_b_fixture_supports_dual_storage(tmp_path):
     """Ensure Tier B mixed-format uploads still materialize SQLite tables."""
 
     source_id = "tier-b-mixed"
-    repo_root = Path(__file__).resolve().parents[1]
-    fixture_path = repo_root / "test_data" / "tier_b" / "B-01-mixed-formats.txt"
+    fixture_path = REPO_ROOT / "test_data" / "tier_b" / "B-01-mixed-formats.txt"
 
     if not fixture_path.is_file():
         pytest.skip("Tier B mixed-format fixture missing; skipping test.")
@@ -0,0 +1,87 @@
+"""Unit tests for the SQLite connection registry."""
+
+from threading import Thread
+from typing import Callable, List
+
+from storage.sqlite_connection import SQLiteConnection
+
+
+def _run_in_thread(target: Callable[[], object]) -> object:
+    result: List[object] = []
+    worker = Thread(target=lambda: result.append(target()))
+    worker.start()
+    worker.join()
+    return result[0]
+
+
+def test_file_connections_are_isolated_per_thread(tmp_path):
+    db_path = str(tmp_path / "etl.db")
+    manager = SQLiteConnection(db_path=db_path)
+    try:
+        main_conn = manager.connect(db_path)
+        worker_conn = _run_in_thread(lambda: manager.connect(db_path))
+
+        assert manager.connect(db_path) is main_conn
+        assert worker_conn is not main_conn
+
+        main_conn.execute("CREATE TABLE t (v INTEGER)")
+        main_conn.execute("INSERT INTO t VALUES (1)")
+        # Separate connections to the same file still see committed rows
+        assert _run_in_thread(
+            lambda: manager.connect(db_path).execute("SELECT v FROM t").fetchall()[0][0]
+        ) == 1
+    finally:
+        manager.disconnect_all()
+
+
+def test_in_memory_connections_are_shared_across_threads():
+    manager = SQLiteConnection(db_path=":memory:")
+    try:
+        main_conn = manager.connect()
+        main_conn.execute("CREATE TABLE t (v INTEGER)")
+
+        assert _run_in_thread(manager.connect) is main_conn
+    finally:
+        manager.disconnect_all()
+
+
+def test_disconnect_invalidates_every_threads_cached_connection(tmp_path):
+    db_path = str(tmp_path / "etl.db")
+    manager = SQLiteConnection(db_path=db_path)
+    try:
+        main_before = manager.connect(db_path)
+        worker_before = _run_in_thread(lambda: manager.connect(db_path))
+
+        manager.disconnect(db_path)
+
+        main_after = manager.connect(db_path)
+        worker_after = _run_in_thread(lambda: manager.connect(db_path))
+        assert main_after is not main_before
+        assert worker_after is not worker_before
+        assert main_after.execute("SELECT 1").fetchone()[0] == 1
+    finally:
+        manager.disconnect_all()
+
+
+def test_disconnect_all_can_keep_the_default_database(tmp_path):
+    default_path = str(tmp_path / "default.db")
+    version_path = str(tmp_path / "v2.db")
+    manager = SQLiteConnection(db_path=default_path)
+    try:
+        default_conn = manager.connect()
+        version_conn = manager.connect(version_path)
+        manager.set_table_plan(default_path, "docs", "default-plan")
+        manager.set_table_plan(version_path, "docs", "version-plan")
+
+        manager.disconnect_all(keep_default=True)
+
+        assert manager.connect() is default_conn
+        assert manager.connect(version_path) is not version_conn
+        assert manager.get_table_plan(default_path, "docs") == "default-plan"
+        assert manager.get_table_plan(version_path, "docs") is None
+
+        manager.disconnect_all()
+        assert manager.connect() is not default_conn
+        assert manager.get_table_plan(default_path, "docs") is None
+    finally:
+        manager.disconnect_all()
@@ -0,0 +1,185 @@
+"""Unit tests for SQLite document insertion helpers."""
+
+from typing import Any, Dict, List
+
+import storage.sqlite_document_inserter as inserter
+from core import SchemaField
+from storage.sqlite_connection import SQLiteConnection
+from storage.sqlite_document_inserter import (
+    batch_insert_documents_sqlite,
+    flatten_document,
+    insert_documents_sqlite,
+    serialize_value,
+)
+from storage.sqlite_table_manager import create_table_from_schema, get_table_columns
+
+DB = ":memory:"
+DATA_COLUMNS = "name, score, meta_city, _source_id"
+
+FIELDS = [
+    SchemaField(name="name", type="string", nullable=False),
+    SchemaField(name="score", type="integer"),
+    SchemaField(name="meta_city", type="string"),
+]
+
+
+def _stored_rows(conn: SQLiteConnection, table_name: str, columns: str) -> list:
+    cursor = conn.execute(f"SELECT {columns} FROM {table_name} ORDER BY _id", db_path=DB)
+    return [tuple(row) for row in cursor.fetchall()]
+
+
+def _documents(count: int) -> List[Dict[str, Any]]:
+    return [{"name": f"n{i}", "score": i, "meta": {"city": f"c{i % 7}"}} for i in range(count)]
+
+
+def _insert_per_row(
+    conn: SQLiteConnection, table_name: str, documents: List[Dict[str, Any]], source_id: str
+) -> int:
+    """Reference: the original one-INSERT-per-document path."""
+    data_columns = [c for c in get_table_columns(conn, DB, table_name) if not c.startswith("_")]
+    insert_sql = (
+        f"INSERT INTO {table_name} ({', '.join(data_columns)}, _source_id) "
+        f"VALUES ({', '.join(['?'] * (len(data_columns) + 1))})"
+    )
+    inserted = 0
+    for doc in documents:
+        flattened = flatten_document(doc)
+        values = tuple(serialize_value(flattened.get(col)) for col in data_columns)
+        try:
+            conn.execute(insert_sql, values + (source_id,), db_path=DB)
+            inserted += 1
+        except Exception:
+            continue
+    return inserted
+
+
+def _assert_matches_per_row(conn, documents, insert) -> None:
+    create_table_from_schema(conn, DB, "fast", FIELDS)
+    create_table_from_schema(conn, DB, "reference", FIELDS)
+
+    assert insert("fast", documents) == _insert_per_row(conn, "reference", documents, "src")
+    assert _stored_rows(conn, "fast", DATA_COLUMNS) == _stored_rows(
+        conn, "reference", DATA_COLUMNS
+    )
+
+
+def test_list_and_dict_cells_keep_json_dumps_default_format(isolated_sqlite_connection):
+    conn = isolated_sqlite_connection
+    fields = [
+        SchemaField(name="tags", type="array"),
+        SchemaField(name="notes", type="string"),
+    ]
+    create_table_from_schema(conn, DB, "docs", fields)
+
+    insert_documents_sqlite(
+        conn, DB, "docs", [{"tags": ["a", "é"], "notes": ["x", 1]}], "src", fields=fields
+    )
+
+    # Same TEXT as json.dumps(value) with its default separators and escapes
+    assert _stored_rows(conn, "docs", "tags, notes") == [('["a", "\\u00e9"]', '["x", 1]')]
+    assert serialize_value({"k": "é", "n": [1, 2]}) == '{"k": "\\u00e9", "n": [1, 2]}'
+
+
+def test_batch_that_is_not_a_multiple_of_the_group_size_matches_per_row(
+    isolated_sqlite_connection,
+):
+    conn = isolated_sqlite_connection
+    documents = _documents(2 * inserter.ROWS_PER_INSERT_STATEMENT + 5)
+
+    _assert_matches_per_row(
+        conn,
+        documents,
+        lambda table, docs: insert_documents_sqlite(conn, DB, table, docs, "src", fields=FIELDS),
+    )
+    assert len(_stored_rows(conn, "fast", "name")) == len(documents)
+
+
+def test_rows_per_statement_is_capped_by_the_variable_limit(
+    isolated_sqlite_connection, monkeypatch
+):
+    conn = isolated_sqlite_connection
+    # 3 data columns + _source_id: 10 variables leave room for 2 rows per statement
+    monkeypatch.setattr(inserter, "_MAX_VARIABLES", 10)
+
+    _assert_matches_per_row(
+        conn,
+        _documents(7),
+        lambda table, docs: batch_insert_documents_sqlite(
+            conn, DB, table, docs, "src", batch_size=5, fields=FIELDS
+        ),
+    )
+
+    plan = inserter._get_insert_plan(conn, DB, "fast")
+    assert plan.rows_per_statement == 2
+    assert plan.multi_insert_sql.count("?") == 8
+
+    monkeypatch.setattr(inserter, "_MAX_VARIABLES", 3)
+    create_table_from_schema(conn, DB, "narrow", FIELDS)
+    assert inserter._get_insert_plan(conn, DB, "narrow").rows_per_statement == 1
+
+
+def test_not_null_violations_are_dropped_before_the_bulk_insert(
+    isolated_sqlite_connection, caplog
+):
+    conn = isolated_sqlite_connection
+    documents = _documents(10)
+    del documents[2]["name"]
+    documents[6]["name"] = None
+
+    _assert_matches_per_row(
+        conn,
+        documents,
+        lambda table, docs: insert_documents_sqlite(conn, DB, table, docs, "src", fields=FIELDS),
+    )
+
+    assert len(_stored_rows(conn, "fast", "name")) == 8
+    assert "Skipped 2 document(s) for fast with missing NOT NULL values" in caplog.text
+    assert "retrying row by row" not in caplog.text
+
+
+def test_failed_bulk_insert_rolls_back_and_retries_row_by_row(
+    isolated_sqlite_connection, caplog
+):
+    conn = isolated_sqlite_connection
+    documents = _documents(inserter.ROWS_PER_INSERT_STATEMENT + 10)
+    # Duplicates in both the multi-row group and the executemany tail
+    documents[40]["name"] = "n3"
+    documents[70]["name"] = "n1"
+
+    create_table_from_schema(conn, DB, "fast", FIELDS)
+    create_table_from_schema(conn, DB, "reference", FIELDS)
+    for table_name in ("fast", "reference"):
+        conn.execute(
+            f"CREATE UNIQUE INDEX idx_{table_name}_name ON {table_name}(name)", db_path=DB
+        )
+
+    inserted = insert_documents_sqlite(conn, DB, "fast", documents, "src", fields=FIELDS)
+
+    assert inserted == _insert_per_row(conn, "reference", documents, "src") == len(documents) - 2
+    assert _stored_rows(conn, "fast", DATA_COLUMNS) == _stored_rows(
+        conn, "reference", DATA_COLUMNS
+    )
+    assert "retrying row by row" in caplog.text
+    assert not conn.get_connection(DB).in_transaction
+
+
+def test_insert_plan_is_cached_per_connection_until_ddl(isolated_sqlite_connection):
+    conn = isolated_sqlite_connection
+    create_table_from_schema(conn, DB, "docs", FIELDS)
+
+    plan = inserter._get_insert_plan(conn, DB, "docs")
+    assert inserter._get_insert_plan(conn, DB, "docs") is plan
+    assert plan.data_columns == ("name", "score", "meta_city")
+    assert plan.required_positions == (0,)
+
+    other = SQLiteConnection(db_path=DB)
+    try:
+        assert other.get_table_plan(DB, "docs") is None
+    finally:
+        other.disconnect()
+
+    conn.execute("DROP TABLE docs", db_path=DB)
+    create_table_from_schema(conn, DB, "docs", FIELDS[:2])
+    rebuilt = inserter._get_insert_plan(conn, DB, "docs")
+    assert rebuilt is not plan
+    assert rebuilt.data_columns == ("name", "score")
@@ -0,0 +1,116 @@
+"""Unit tests for SQLite table creation options."""
+
+import sqlite3
+
+import pytest
+
+import storage.sqlite_table_manager as table_manager
+from core import SchemaField
+from storage.sqlite_connection import SQLiteConnection
+from storage.sqlite_table_manager import create_table_from_schema, get_table_columns
+
+DB = ":memory:"
+
+FIELDS = [
+    SchemaField(name="sku", type="string", nullable=False),
+    SchemaField(name="price", type="number"),
+    SchemaField(name="listed_at", type="datetime"),
+    SchemaField(name="released", type="date"),
+]
+
+requires_strict = pytest.mark.skipif(
+    sqlite3.sqlite_version_info < table_manager._STRICT_MIN_SQLITE_VERSION,
+    reason="STRICT tables need SQLite 3.37+",
+)
+
+
+def _table_sql(conn: SQLiteConnection, table_name: str) -> str:
+    cursor = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table_name,), db_path=DB
+    )
+    return cursor.fetchone()[0]
+
+
+def test_default_table_keeps_rowid_and_declared_types(isolated_sqlite_connection):
+    conn = isolated_sqlite_connection
+
+    assert create_table_from_schema(conn, DB, "items", FIELDS)
+
+    sql = _table_sql(conn, "items")
+    assert "_id INTEGER PRIMARY KEY AUTOINCREMENT" in sql
+    assert "listed_at TIMESTAMP NULL" in sql
+    assert "released DATE NULL" in sql
+    assert "STRICT" not in sql and "WITHOUT ROWID" not in sql
+
+
+def test_without_rowid_keys_the_table_by_the_primary_key(isolated_sqlite_connection):
+    conn = isolated_sqlite_connection
+
+    assert create_table_from_schema(
+        conn, DB, "items", FIELDS, primary_key="sku", without_rowid=True
+    )
+
+    sql = _table_sql(conn, "items")
+    assert sql.endswith(") WITHOUT ROWID")
+    assert "sku TEXT NOT NULL PRIMARY KEY" in sql
+    assert "_id" not in get_table_columns(conn, DB, "items")
+
+    conn.execute("INSERT INTO items (sku, price) VALUES ('a', 1.5)", db_path=DB)
+    with pytest.raises(sqlite3.IntegrityError):
+        conn.execute("INSERT INTO items (sku, price) VALUES ('a', 2.0)", db_path=DB)
+
+
+def test_without_rowid_falls_back_without_a_known_primary_key(
+    isolated_sqlite_connection, caplog
+):
+    conn = isolated_sqlite_connection
+
+    assert create_table_from_schema(
+        conn, DB, "items", FIELDS, primary_key="missing", without_rowid=True
+    )
+
+    sql = _table_sql(conn, "items")
+    assert "WITHOUT ROWID" not in sql
+    assert "_id INTEGER PRIMARY KEY AUTOINCREMENT" in sql
+    assert "WITHOUT ROWID requested for 'items' without a known primary key" in caplog.text
+
+
+@requires_strict
+def test_strict_maps_timestamp_and_date_columns_to_text(isolated_sqlite_connection):
+    conn = isolated_sqlite_connection
+
+    assert create_table_from_schema(
+        conn, DB, "items", FIELDS, primary_key="sku", without_rowid=True, strict=True
+    )
+
+    sql = _table_sql(conn, "items")
+    assert sql.endswith(") STRICT, WITHOUT ROWID")
+    assert "listed_at TEXT NULL" in sql
+    assert "released TEXT NULL" in sql
+    assert "_ingested_at TEXT DEFAULT CURRENT_TIMESTAMP" in sql
+    assert "price REAL NULL" in sql
+
+    with pytest.raises(sqlite3.IntegrityError):
+        conn.execute("INSERT INTO items (sku, price) VALUES ('a', 'cheap')", db_path=DB)
+
+
+def test_strict_falls_back_for_unknown_field_types(isolated_sqlite_connection, caplog):
+    conn = isolated_sqlite_connection
+    fields = FIELDS + [SchemaField(name="blob", type="mystery")]
+
+    assert create_table_from_schema(conn, DB, "items", fields, strict=True)
+
+    sql = _table_sql(conn, "items")
+    assert "STRICT" not in sql
+    assert "listed_at TIMESTAMP NULL" in sql
+    assert "STRICT not applicable to 'items'; using a regular table" in caplog.text
+
+
+def test_strict_falls_back_on_old_sqlite(isolated_sqlite_connection, monkeypatch, caplog):
+    conn = isolated_sqlite_connection
+    monkeypatch.setattr(table_manager, "_STRICT_MIN_SQLITE_VERSION", (99, 0, 0))
+
+    assert create_table_from_schema(conn, DB, "items", FIELDS, strict=True)
+
+    assert "STRICT" not in _table_sql(conn, "items")
+    assert "STRICT not applicable to 'items'" in caplog.text
@@ -10,6 +10,8 @@ from services.pipeline_service import process_upload
 from services import query_service, schema_service
 from tests.payloads import TEST_PAYLOADS
 
+pytestmark = pytest.mark.mongo
+
 
 def _write_payload(tmp_path, content: str, suffix: str = ".txt") -> str:
     file_path = tmp_path / f"tier_a_{uuid4().hex}{suffix}"
@@ -18,9 +20,9 @@ def _write_payload(tmp_path, content: str, suffix: str = ".txt") -> str:
 
 
 @pytest.mark.integration
-def test_tier_a01_kv_and_json_fragments(tmp_path):
+def test_tier_a01_kv_and_json_fragments(materialized_payload):
     source_id = "tier-a-01"
-    file_path = _write_payload(tmp_path, TEST_PAYLOADS["tier_a_01_kv_and_json"])
+    file_path = materialized_payload("tier_a_01_kv_and_json")
 
     response = process_upload(file_path, source_id)
 
@@ -38,13 +40,9 @@ def test_tier_a01_kv_and_json_fragments(tmp_path):
 
 
 @pytest.mark.integration
-def test_tier_a02_markdown_code_block(tmp_path):
+def test_tier_a02_markdown_code_block(materialized_payload):
     source_id = "tier-a-02"
-    file_path = _write_payload(
-        tmp_path,
-        TEST_PAYLOADS["tier_a_02_markdown_code_block"],
-        suffix=".md",
-    )
+    file_path = materialized_payload("tier_a_02_markdown_code_block", suffix=".md")
 
     response = process_upload(file_path, source_id)
 
@@ -61,9 +59,9 @@ def test_tier_a02_markdown_code_block(tmp_path):
 
 
 @pytest.mark.integration
-def test_tier_a03_csv_like_text(tmp_path):
+def test_tier_a03_csv_like_text(materialized_payload):
     source_id = "tier-a-03"
-    file_path = _write_payload(tmp_path, TEST_PAYLOADS["tier_a_03_csv_like_text"])
+    file_path = materialized_payload("tier_a_03_csv_like_text")
 
     response = process_upload(file_path, source_id)
 
@@ -82,9 +80,9 @@ def test_tier_a03_csv_like_text(tmp_path):
 
 
 @pytest.mark.integration
-def test_tier_a04_html_snippet(tmp_path):
+def test_tier_a04_html_snippet(materialized_payload):
     source_id = "tier-a-04"
-    file_path = _write_payload(tmp_path, TEST_PAYLOADS["tier_a_04_html_snippet"])
+    file_path = materialized_payload("tier_a_04_html_snippet")
 
     response = process_upload(file_path, source_id)
 
@@ -103,9 +101,9 @@ def test_tier_a04_html_snippet(tmp_path):
 
 
 @pytest.mark.integration
-def test_tier_a05_pdf_like_text(tmp_path):
+def test_tier_a05_pdf_like_text(materialized_payload):
     source_id = "tier-a-05"
-    file_path = _write_payload(tmp_path, TEST_PAYLOADS["tier_a_05_pdf_like_text"])
+    file_path = materialized_payload("tier_a_05_pdf_like_text")
 
     response = process_upload(file_path, source_id)
 
@@ -121,9 +119,9 @@ def test_tier_a05_pdf_like_text(tmp_path):
 
 
 @pytest.mark.integration
-def test_tier_a06_duplicate_upload_idempotent(tmp_path):
+def test_tier_a06_duplicate_upload_idempotent(materialized_payload):
     source_id = "tier-a-06"
-    file_path = _write_payload(tmp_path, TEST_PAYLOADS["tier_a_01_kv_and_json"])
+    file_path = materialized_payload("tier_a_01_kv_and_json")
 
     first = process_upload(file_path, source_id)
     second = process_upload(file_path, source_id)
@@ -135,12 +133,12 @@ def test_tier_a06_duplicate_upload_idempotent(tmp_path):
 
 
 @pytest.mark.integration
-def test_tier_a07_whitespace_variation_no_schema_churn(tmp_path):
+def test_tier_a07_whitespace_variation_no_schema_churn(tmp_path, materialized_payload):
     source_id = "tier-a-07"
     base_content = TEST_PAYLOADS["tier_a_01_kv_and_json"]
     variant_content = "\n".join(f"  {line}  " for line in base_content.splitlines())
 
-    base_path = _write_payload(tmp_path, base_content)
+    base_path = materialized_payload("tier_a_01_kv_and_json")
     variant_path = _write_payload(tmp_path, variant_content)
 
     first = process_upload(base_path, source_id)
@@ -150,9 +148,9 @@ def test_tier_a07_whitespace_variation_no_schema_churn(tmp_path):
 
 
 @pytest.mark.integration
-def test_tier_a08_malformed_json_surfaces_error(tmp_path):
+def test_tier_a08_malformed_json_surfaces_error(materialized_payload):
     source_id = "tier-a-08"
-    file_path = _write_payload(tmp_path, TEST_PAYLOADS["tier_a_08_malformed_json"])
+    file_path = materialized_payload("tier_a_08_malformed_json")
 
     response = process_upload(file_path, source_id)
 
@@ -9,6 +9,8 @@ import pytest
 from services.pipeline_service import process_upload
 from services import query_service, schema_service
 
+pytestmark = pytest.mark.mongo
+
 
 FIXTURE_DIR = Path(__file__).resolve().parents[1] / "test_data" / "tier_b"
 
@@ -0,0 +1,112 @@
+"""Unit tests for the shared utility helpers."""
+
+import json
+
+import orjson
+import pytest
+
+from utils import serialization
+from utils.file_handler import ensure_directory, read_text_file, write_text_file
+from utils.helpers import chunk_list, merge_dicts
+from utils.serialization import dumps_json, loads_json
+from utils.validators import assert_supported_source_type, ensure_required_keys
+
+
+def test_chunk_list_yields_fixed_size_chunks_from_any_iterable():
+    assert list(chunk_list([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+    assert list(chunk_list((char for char in "abc"), 3)) == [["a", "b", "c"]]
+    assert list(chunk_list([], 4)) == []
+
+
+def test_chunk_list_rejects_non_positive_sizes():
+    with pytest.raises(ValueError):
+        list(chunk_list([1], 0))
+
+
+def test_merge_dicts_prefers_overrides_without_mutating_inputs():
+    base = {"a": 1, "b": {"nested": True}}
+    overrides = {"b": 2, "c": 3}
+
+    assert merge_dicts(base, overrides) == {"a": 1, "b": 2, "c": 3}
+    assert base == {"a": 1, "b": {"nested": True}}
+    assert overrides == {"b": 2, "c": 3}
+
+
+def test_read_text_file_matches_text_mode_newline_handling(tmp_path):
+    file_path = tmp_path / "mixed.txt"
+    file_path.write_bytes("a: 1\r\nb: 2\rc: é\n".encode("utf-8"))
+
+    with open(file_path, encoding="utf-8") as handle:
+        expected = handle.read()
+
+    assert read_text_file(str(file_path)) == expected == "a: 1\nb: 2\nc: é\n"
+
+
+def test_write_text_file_round_trips_utf8_content(tmp_path):
+    file_path = tmp_path / "out.txt"
+
+    write_text_file(str(file_path), "name: Zoë\nvalue: 1\n")
+
+    assert file_path.read_bytes() == "name: Zoë\nvalue: 1\n".encode("utf-8")
+    assert read_text_file(str(file_path)) == "name: Zoë\nvalue: 1\n"
+
+
+def test_ensure_directory_creates_parents_and_is_idempotent(tmp_path):
+    target = tmp_path / "a" / "b"
+
+    assert ensure_directory(str(target)) == target
+    assert ensure_directory(str(target)) == target
+    assert target.is_dir()
+
+
+def test_ensure_required_keys_reports_all_missing_keys():
+    ensure_required_keys({"a": 1, "b": 2}, {"a"})
+
+    with pytest.raises(ValueError, match=r"\['b', 'c'\]"):
+        ensure_required_keys({"a": 1}, {"a", "b", "c"})
+
+
+def test_assert_supported_source_type():
+    assert_supported_source_type("json", frozenset({"json", "kv"}))
+
+    with pytest.raises(ValueError):
+        assert_supported_source_type("xml", frozenset({"json", "kv"}))
+
+
+_JSON_SAMPLE = {
+    "name": "Zoë",
+    "line": "a\u2028b",
+    "nested": {"z": [1, 2.5, -0.0, None], "a": {"ok": True, "no": False}},
+    1: "int key",
+}
+
+
+@pytest.mark.parametrize("sort_keys", [False, True])
+def test_dumps_json_fallback_matches_orjson_output(monkeypatch, sort_keys):
+    expected = dumps_json(_JSON_SAMPLE, sort_keys=sort_keys)
+
+    def _reject(*args, **kwargs):
+        raise TypeError("rejected")
+
+    monkeypatch.setattr(serialization.orjson, "dumps", _reject)
+
+    assert dumps_json(_JSON_SAMPLE, sort_keys=sort_keys) == expected
+
+
+def test_dumps_json_falls_back_for_integers_orjson_rejects():
+    value = {"big": 2**64, "name": "é"}
+
+    with pytest.raises(TypeError):
+        orjson.dumps(value)
+    assert dumps_json(value) == '{"big":18446744073709551616,"name":"é"}'
+
+
+def test_loads_json_matches_stdlib_and_accepts_what_orjson_rejects():
+    text = dumps_json(_JSON_SAMPLE)
+
+    assert loads_json(text) == json.loads(text)
+    assert loads_json('{"big": 18446744073709551616}') == {"big": 2**64}
+    assert loads_json("[NaN]")[0] != loads_json("[NaN]")[0]
+
+    with pytest.raises(json.JSONDecodeError):
+        loads_json("{not json")
@@ -3,21 +3,45 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Union
 
 
 def read_text_file(file_path: str) -> str:
-    """Read a UTF-8 text file."""
+    """Read a UTF-8 text file in one bulk decode, with text-mode newline handling.
 
-    raise NotImplementedError
+    Equivalent to ``open(file_path, encoding="utf-8").read()``: ``\\r\\n`` and
+    lone ``\\r`` line endings are translated to ``\\n``, as universal newlines
+    mode does, but without the incremental text-mode decoder.
+    """
+
+    return decode_text(Path(file_path).read_bytes())
+
+
+def decode_text(content: Union[bytes, str]) -> str:
+    """Decode UTF-8 content and translate ``\\r\\n``/``\\r`` line endings to ``\\n``."""
+
+    text = content.decode("utf-8") if isinstance(content, bytes) else content
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 def write_text_file(file_path: str, content: str) -> None:
-    """Write content to a UTF-8 text file."""
+    """Write content to a UTF-8 text file.
+
+    The text is encoded up front and written as bytes in one call, so no
+    text-mode layer or newline translation sits between ``content`` and disk.
+    """
 
-    raise NotImplementedError
+    Path(file_path).write_bytes(content.encode("utf-8"))
 
 
 def ensure_directory(path: str) -> Path:
-    """Ensure that a directory exists."""
+    """Ensure that a directory exists, creating missing parents, and return it.
+
+    Existing directories are accepted, so repeated calls are safe.
+    """
 
-    raise NotImplementedError
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
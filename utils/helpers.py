@@ -2,16 +2,34 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
 
 
 def merge_dicts(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
-    """Return a new dict merging base with overrides."""
+    """Return a new dict merging base with overrides.
 
-    raise NotImplementedError
+    The merge is shallow: keys in ``overrides`` replace those in ``base``, and
+    the result is built in a single pass at its final size. Neither input is
+    modified.
+    """
 
+    return {**base, **overrides}
 
-def chunk_list(items: list[Any], chunk_size: int):
-    """Yield successive chunks from a list."""
 
-    raise NotImplementedError
+def chunk_list(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Yield successive chunks of at most ``chunk_size`` items.
+
+    Accepts any iterable and pulls items lazily, so generators are chunked
+    without being materialized up front.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
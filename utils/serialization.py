@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import json
 from datetime import date, datetime, time
-from typing import Any
+from typing import Any, Callable, Dict, List, Optional
+
+import orjson
+
+
+# Exact types that are already JSON-serializable leaves and returned as-is
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None)})
 
 
 def coerce_to_json_serializable(value: Any) -> Any:
@@ -11,21 +18,138 @@ def coerce_to_json_serializable(value: Any) -> Any:
 
     Ensures objects like ``datetime`` and ``date`` are turned into ISO8601
     strings before they enter schema inference or storage layers.
+
+    Plain ``dict`` and ``list`` containers whose contents need no conversion
+    are returned unchanged rather than copied, so the result may share
+    structure with ``value``.
     """
 
+    value_type = type(value)
+    if value_type in _PASSTHROUGH_TYPES:
+        return value
+
+    if value_type is dict:
+        return _coerce_dict(value)
+
+    if value_type is list:
+        return _coerce_list(value)
+
     if isinstance(value, dict):
         return {key: coerce_to_json_serializable(val) for key, val in value.items()}
 
-    if isinstance(value, list):
-        return [coerce_to_json_serializable(item) for item in value]
-
-    if isinstance(value, tuple):
+    if isinstance(value, (list, tuple)):
         return [coerce_to_json_serializable(item) for item in value]
 
     if isinstance(value, set):
-        return [coerce_to_json_serializable(item) for item in sorted(value, key=str)]
+        return [coerce_to_json_serializable(item) for item in _sorted_set_items(value)]
 
     if isinstance(value, (datetime, date, time)):
         return value.isoformat()
 
     return value
+
+
+def _sorted_set_items(value: Any) -> List[Any]:
+    """Sort set members by their ``str`` form.
+
+    For sets made only of plain strings, ``str(item)`` is the item itself, so
+    the natural ordering is identical and the per-item key calls are skipped.
+    """
+
+    if all(type(item) is str for item in value):
+        return sorted(value)
+    return sorted(value, key=str)
+
+
+def _coerce_dict(value: Dict[Any, Any]) -> Dict[Any, Any]:
+    """Coerce a plain dict's values, copying it only once a value changes."""
+
+    coerced = None
+    for key, val in value.items():
+        new_val = coerce_to_json_serializable(val)
+        if new_val is not val:
+            if coerced is None:
+                coerced = dict(value)
+            coerced[key] = new_val
+    return value if coerced is None else coerced
+
+
+def _coerce_list(value: List[Any]) -> List[Any]:
+    """Coerce a plain list's items, copying it only once an item changes."""
+
+    coerced = None
+    for index, item in enumerate(value):
+        new_item = coerce_to_json_serializable(item)
+        if new_item is not item:
+            if coerced is None:
+                coerced = list(value)
+            coerced[index] = new_item
+    return value if coerced is None else coerced
+
+
+def dumps_json(
+    value: Any,
+    *,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """Serialize ``value`` to compact JSON with orjson.
+
+    Falls back to the stdlib encoder for inputs orjson rejects (e.g. integers
+    wider than 64 bits). The fallback writes the same compact, non-ASCII-escaped
+    text; only floats in exponent notation are spelled differently (``1e+16``
+    instead of ``1e16``).
+    """
+
+    option = orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(value, default=default, option=option).decode("utf-8")
+    except TypeError:
+        pass
+
+    if sort_keys:
+        # orjson sorts non-str keys by their JSON text; json.dumps would
+        # compare the raw keys and fail on mixed types.
+        value = _stringify_keys(value)
+    return json.dumps(
+        value,
+        sort_keys=sort_keys,
+        default=default,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+_SCALAR_KEY_TYPES = (int, float, bool, type(None))
+
+
+def _stringify_keys(value: Any) -> Any:
+    """Convert scalar dict keys to their JSON text, recursing into containers."""
+
+    if isinstance(value, dict):
+        return {
+            json.dumps(key) if isinstance(key, _SCALAR_KEY_TYPES) else key: _stringify_keys(val)
+            for key, val in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_stringify_keys(item) for item in value]
+    return value
+
+
+def loads_json(text: str) -> Any:
+    """Parse JSON ``text`` with orjson.
+
+    orjson is stricter than the stdlib decoder (it rejects ``NaN``/``Infinity``
+    literals, integers wider than 64 bits and lone surrogates), so anything it
+    refuses is retried with ``json.loads``. Invalid input raises
+    ``json.JSONDecodeError`` from either path.
+    """
+
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        pass
+
+    return json.loads(text)
@@ -6,12 +6,25 @@ from typing import Any, Dict
 
 
 def ensure_required_keys(payload: Dict[str, Any], required_keys: set[str]) -> None:
-    """Ensure payload contains all required keys."""
+    """Ensure payload contains all required keys.
 
-    raise NotImplementedError
+    Raises:
+        ValueError: Listing every missing key, in sorted order.
+    """
+
+    missing = required_keys - payload.keys()
+    if missing:
+        raise ValueError(f"Missing required keys: {sorted(missing)}")
 
 
 def assert_supported_source_type(source_type: str, allowed: set[str]) -> None:
-    """Validate that the source type is supported."""
+    """Validate that the source type is supported.
+
+    Raises:
+        ValueError: If ``source_type`` is not one of ``allowed``.
+    """
 
-    raise NotImplementedError
+    if source_type not in allowed:
+        raise ValueError(
+            f"Unsupported source type '{source_type}'. Expected one of: {sorted(allowed)}"
+        )